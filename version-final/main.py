@@ -7,10 +7,12 @@ Done for a University project.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-import threading
-import time
+from collections import Counter, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+import heapq
 import os
-import sys
+import time
 from datetime import datetime
 import json
 import platform
@@ -35,110 +37,179 @@ def enable_high_dpi_awareness():
         except Exception:
             pass
 
-# Matplotlib for plotting charts
-try:
-    import matplotlib
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-except Exception:
-    matplotlib = None
-    plt = None
-    FigureCanvasTkAgg = None
-
-
-# Add tools directory to path
-sys.path.append('tools')
-
+# orjson is optional; when installed it reads and writes session/history JSON
 try:
-    from tools.network_scanner import NetworkScanner
-    from tools.port_scanner import PortScanner
-    from tools.hash_verifier import HashVerifier
-    from tools.password import password_strength, strengthen_password
-    from tools.aes_tool import encrypt_file, decrypt_file, AesResult
-    from tools.breach_checker import BreachChecker
-    from tools.steganography import SteganographyTool
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    # Fallback mock classes if tools aren't available
-    class NetworkScanner:
-        def scan(self, network): 
-            time.sleep(2)
-            return f"""Network Scan Results for {network}
-═══════════════════════════════════════════════════
-📡 Scan Summary:
-• Target: {network}
-• Hosts Found: 8
-• Scan Duration: 2.1s
-• Timestamp: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
-🏠 Active Hosts:
-IP Address      MAC Address           Hostname
---------------------------------------------------
-192.168.1.1     00:11:22:33:44:55     Router
-192.168.1.2     AA:BB:CC:DD:EE:FF     Desktop PC
-192.168.1.5     11:22:33:44:55:66     Laptop
-192.168.1.10    22:33:44:55:66:77     Smartphone
-192.168.1.15    33:44:55:66:77:88     IoT Device
-192.168.1.20    44:55:66:77:88:99     Server
-192.168.1.25    55:66:77:88:99:AA     Printer
-192.168.1.30    66:77:88:99:AA:BB     NAS
-
-🔍 Scan completed successfully!
-"""
+    HAS_ORJSON = False
 
-    class PortScanner:
-        def scan(self, target, ports): 
-            time.sleep(3)
-            return f"""Port Scan Results for {target}
-═══════════════════════════════════════════════════
-🎯 Target: {target}
-📊 Port Range: {ports}
-⏱️ Duration: 3.2s
-🕐 Timestamp: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
-🚪 Open Ports:
-PORT    STATE   SERVICE     VERSION
-22/tcp  open    ssh         OpenSSH 8.2
-80/tcp  open    http        Apache 2.4
-443/tcp open    https       Apache 2.4
-3389/tcp open   rdps        Microsoft RDP
-
-📈 Statistics:
-• Total Ports Scanned: 1000
-• Open Ports: 4
-• Filtered Ports: 12
-• Closed Ports: 984
-
-🔒 Security Notes:
-• SSH running on standard port
-• HTTP service detected
-• HTTPS service available
-• RDP accessible from network
-"""
+def write_json(path, data):
+    """Write `data` to `path` as indented UTF-8 JSON."""
+    if HAS_ORJSON:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
-    class HashVerifier:
-        def verify(self, path, algo, expected=None): 
-            time.sleep(1)
-            file_hash = "a1b2c3d4e5f6789012345678901234567890" if algo == 'sha256' else "d41d8cd98f00b204e9800998ecf8427e"
-            status = "✅ VERIFIED" if expected and expected.lower() == file_hash else "⚠️ NOT VERIFIED" if expected else "🔍 GENERATED"
-            
-            return f"""Hash Verification Results
-═══════════════════════════════════════════════════
-📁 File: {path}
-🔢 Algorithm: {algo.upper()}
-⏱️ Processing Time: 1.2s
-🕐 Timestamp: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
-🔑 Generated Hash:
-{file_hash}
+def read_json(path):
+    """Load a JSON document from `path`."""
+    if HAS_ORJSON:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-{'🎯 Expected Hash: ' + expected if expected else '📝 No expected hash provided'}
 
-📊 Status: {status}
+# Matplotlib for plotting charts, imported the first time the Charts tab draws
+Figure = None
+FigureCanvasTkAgg = None
 
-{'✅ Hashes match! File integrity verified.' if expected and expected.lower() == file_hash else 
-  '❌ Hashes do not match! File may be compromised.' if expected else 
-  '📋 Hash generated successfully. Copy for verification.'}
-"""
+
+def load_matplotlib():
+    """Import the matplotlib pieces used by the Charts tab; False if unavailable."""
+    global Figure, FigureCanvasTkAgg
+    if FigureCanvasTkAgg is None:
+        try:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        except Exception:
+            return False
+    return True
+
+
+# Results longer than this are cut before being handed to a Text widget
+MAX_RESULTS_CHARS = 1_000_000
+
+# Breach CSV files whose chart counts are kept in memory
+CSV_COUNT_CACHE_SIZE = 4
+
+# Number of activities kept for the dashboard's recent activity list
+RECENT_ACTIVITY_LIMIT = 5
+
+# Lines held in a VirtualLogView's Text widget at any one time
+VIRTUAL_LOG_WINDOW = 200
+
+# Fixed locations next to this file, resolved once at import
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGES_DIR = os.path.join(APP_DIR, 'images')
+HISTORY_PATH = os.path.join(APP_DIR, 'history.jsonl')
+LEGACY_HISTORY_PATH = os.path.join(APP_DIR, 'history.json')
+
+# Spinner dot colours for each animation phase, per theme. Each phase shifts
+# the pulse by one dot; computed once so a tick is just three itemconfigs.
+_SPINNER_PULSE = (1.0, 0.6, 0.3, 0.6, 1.0, 0.6)
+SPINNER_FRAMES = {
+    theme: tuple(
+        tuple(
+            '#{:02x}{:02x}{:02x}'.format(*(int(c * _SPINNER_PULSE[(i + phase) % 6]) for c in rgb))
+            for i in range(3)
+        )
+        for phase in range(6)
+    )
+    for theme, rgb in (('dark', (0, 255, 136)), ('light', (0, 119, 255)))
+}
+
+# Decoded images keyed by (absolute path, target size); a target of None holds
+# the full-size decode. Tk images belong to the interpreter that created them,
+# which is why the login window and the main app share one Tk root.
+_IMAGE_CACHE = {}
+
+
+def load_photo(path, target=200):
+    """Load an image once and subsample it so its longest side is about `target` px."""
+    full_path = os.path.abspath(path)
+    img = _IMAGE_CACHE.get((full_path, target))
+    if img is None:
+        raw = _IMAGE_CACHE.get((full_path, None))
+        if raw is None:
+            raw = _IMAGE_CACHE[(full_path, None)] = tk.PhotoImage(file=full_path)
+        factor = max(1, int(max(raw.width(), raw.height()) / target))
+        img = raw.subsample(factor, factor) if factor > 1 else raw
+        _IMAGE_CACHE[(full_path, target)] = img
+    return img
+
+
+class VirtualLogView(tk.Frame):
+    """Read-only list of text lines that only renders the part being viewed.
+
+    The Text widget holds at most `window` lines starting at `first`;
+    scrolling moves `first` and re-renders, so a history of any length
+    scrolls as fast as a short one.
+    """
+
+    def __init__(self, master, lines, window=VIRTUAL_LOG_WINDOW, **text_options):
+        super().__init__(master, bg=text_options.get('bg'))
+        self.lines = lines
+        self.window = window
+        self.first = 0
+        self.scrollbar = tk.Scrollbar(self, orient='vertical', command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+        self.text = tk.Text(self, **text_options)
+        self.text.pack(side='left', fill='both', expand=True)
+        # Mouse wheel (Windows/macOS and X11), paging keys and resizes all
+        # go through the virtual index instead of the Text's own scrolling
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.text.bind(sequence, self._on_wheel)
+        self.text.bind('<Prior>', lambda e: self.yview('scroll', -1, 'pages') or 'break')
+        self.text.bind('<Next>', lambda e: self.yview('scroll', 1, 'pages') or 'break')
+        self.text.bind('<Configure>', lambda e: self._update_scrollbar())
+        self._render()
+
+    def _visible_lines(self):
+        """Number of lines that currently fit in the Text widget"""
+        bottom = self.text.index(f'@0,{self.text.winfo_height()}')
+        return max(1, int(bottom.split('.')[0]))
+
+    def _render(self):
+        self.text.configure(state='normal')
+        self.text.replace('1.0', tk.END, '\n'.join(self.lines[self.first:self.first + self.window]))
+        self.text.configure(state='disabled')
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = len(self.lines)
+        if not total:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        self.scrollbar.set(self.first / total, min(1.0, (self.first + self._visible_lines()) / total))
+
+    def _scroll_to(self, first):
+        first = max(0, min(first, len(self.lines) - self._visible_lines()))
+        if first != self.first:
+            self.first = first
+            self._render()
+
+    def yview(self, action, amount, unit=None):
+        """Scrollbar protocol: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        if action == 'moveto':
+            self._scroll_to(int(float(amount) * len(self.lines)))
+        elif action == 'scroll':
+            step = self._visible_lines() if unit == 'pages' else 1
+            self._scroll_to(self.first + int(amount) * step)
+
+    def _on_wheel(self, event):
+        up = event.num == 4 or getattr(event, 'delta', 0) > 0
+        self._scroll_to(self.first + (-3 if up else 3))
+        return 'break'
+
+
+# Set CYBERSEC_DEMO=1 to run with simulated scanner output instead of real scans
+MOCK_MODE = os.environ.get('CYBERSEC_DEMO') == '1'
+
+if MOCK_MODE:
+    from tools._mocks import NetworkScanner, PortScanner, HashVerifier
+else:
+    from tools.network_scanner import NetworkScanner
+    from tools.port_scanner import PortScanner
+    from tools.hash_verifier import HashVerifier
+from tools.password import password_strength, strengthen_password
+from tools.aes_tool import encrypt_file, decrypt_file, AesResult
+from tools.breach_checker import BreachChecker
+from tools.steganography import SteganographyTool
 
 class LoginWindow:
     """Login/Splash screen for the Cybersecurity Multi-Tool"""
@@ -183,7 +254,6 @@ class LoginWindow:
         self.setup_ui()
     
     def center_window(self):
-        """Center the window on the screen"""
         """Center the window on the screen (skip if fullscreen)."""
         try:
             if self.root.attributes("-fullscreen"):
@@ -213,12 +283,8 @@ class LoginWindow:
         
         # Try to load logo, fallback to emoji
         try:
-            img_dir = os.path.join(os.path.dirname(__file__), 'images')
-            logo_path = os.path.join(img_dir, 'logo violet.png')
-            logo_img = tk.PhotoImage(file=logo_path)
-            # Resize logo
-            factor = max(1, int(max(logo_img.width(), logo_img.height()) / 200))
-            logo_img = logo_img.subsample(factor, factor) if factor > 1 else logo_img
+            logo_path = os.path.join(IMAGES_DIR, 'logo violet.png')
+            logo_img = load_photo(logo_path, 200)
             
             logo_label = tk.Label(
                 logo_frame,
@@ -349,14 +415,36 @@ class LoginWindow:
     
     def open_main_app(self):
         """Open the main application window"""
-        self.root.destroy()
-        
-        # Create new root for main app
-        main_root = tk.Tk()
-        app = CyberSecurityTool(main_root)
-        main_root.mainloop()
+        # Reuse the login root (and its mainloop) so images already decoded
+        # in this Tk interpreter stay valid for the main app
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        try:
+            self.root.unbind("<Escape>")
+            self.root.attributes("-fullscreen", False)
+        except Exception:
+            pass
+        CyberSecurityTool(self.root)
 
 class CyberSecurityTool:
+    # Dashboard stat cards: (title, value colour, description, session_data key).
+    # Open ports are not tracked per session, so that card has no key.
+    STAT_SCHEMA = (
+        ("📊 Total Scans", "#00ff88", "Scans this session", 'scans_performed'),
+        ("🚪 Open Ports", "#0099ff", "Discovered ports", None),
+        ("📁 Failed Checks", "#ffaa00", "Integrity failures", 'files_checked'),
+        ("🔒 Breached Emails", "#ff4444", "Compromised emails", 'breached_emails_found'),
+    )
+
+    # Dashboard quick action buttons: (label, method name, accent)
+    QUICK_ACTIONS = (
+        ("📖 View Full Log", 'show_activity_window', False),
+        ("💾 Save Session", 'save_session', False),
+        ("📂 Load Session", 'load_session', False),
+        ("🗑️ Clear Results", 'clear_all_results', False),
+        ("📤 Export Results", 'export_results', False),
+    )
+
     def __init__(self, root):
         self.root = root    
         try:
@@ -393,16 +481,58 @@ class CyberSecurityTool:
             'scans_performed': 0,
             'last_scan': None,
             'results_history': [],
-            'recent_activities': [],
+            'recent_activities': deque(maxlen=RECENT_ACTIVITY_LIMIT),
             'breached_emails_found': 0,
             'files_checked': 0
         }
         # Track whether the current session is saved to disk
         self.session_saved = True
+        # One bounded worker pool for all background tool runs
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='scan')
+        # Tools with a run in flight, so repeated clicks don't queue duplicate work
+        self._busy = {}
+        # Pending coalesced dashboard repaint (see update_dashboard_activity)
+        self._dashboard_refresh_id = None
+        # Pending coalesced dashboard canvas resize and the size it will apply
+        self._dashboard_resize_id = None
+        self._dashboard_canvas_size = (0, 0)
+        # Activities added since the last repaint, and whether the activity box
+        # lists activities (rather than a placeholder message)
+        self._unshown_activities = 0
+        self._activity_box_has_entries = False
+        # Activity records waiting to be written to the history file
+        self._pending_history = []
+        # History file writes run on their own single thread, so appends stay
+        # in order and disk speed never stalls the event loop
+        self._history_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix='history')
+        # (epoch second, ISO text) of the last history timestamp formatted
+        self._history_ts = (None, '')
+        # Whether a legacy history.json has been looked for this run
+        self._history_migration_checked = False
+        # Widget -> (background palette key, recolor fg) for theme switches
+        self._themed_widgets = None
+        # Theme the ttk notebook style was last configured for
+        self._styled_theme = None
+        # (path, mtime, size) -> (breached, safe, domain_counts) for chart CSVs
+        self._csv_count_cache = {}
+        # Hover handlers for every create_hd_button, registered once on a class tag
+        self.root.bind_class('HDButton', '<Enter>', self._on_hd_button_enter)
+        self.root.bind_class('HDButton', '<Leave>', self._on_hd_button_leave)
+        self.root.bind_class('QuickAction', '<ButtonPress-1>', self._on_quick_action_press)
+        self.root.bind_class('QuickAction', '<Return>', self._on_quick_action_press)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self.setup_hd_ui()
         self.apply_hd_theme()
     
+    def _on_close(self):
+        """Stop accepting background work and close the main window"""
+        self._flush_history()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        # Let queued history appends finish so nothing is lost on exit
+        self._history_io.shutdown(wait=True)
+        self.root.destroy()
+    
     def setup_hd_styles(self):
         """Setup styles with modern color scheme"""
         self.colors = {
@@ -437,6 +567,19 @@ class CyberSecurityTool:
                 'transparent_bg': '#ffffff'
             }
         }
+        # Lookups for update_widget_colors, built once: any palette's background
+        # colour maps to the palette key that replaces it, and any palette's text
+        # colour is swapped for the new text_primary
+        self._theme_bg_keys = {
+            palette[key]: key
+            for palette in self.colors.values()
+            for key in ('bg', 'card_bg', 'button_bg')
+        }
+        self._theme_fg_colors = frozenset(
+            palette[key]
+            for palette in self.colors.values()
+            for key in ('text_primary', 'text_secondary')
+        )
     
     def setup_hd_ui(self):
         """Setup user interface with modern layout"""
@@ -455,9 +598,10 @@ class CyberSecurityTool:
     
     def create_hd_header(self):
         """Creating a header with modern design"""
+        colors = self.colors['dark']
         header_frame = tk.Frame(
             self.main_container, 
-            bg=self.colors['dark']['card_bg'],
+            bg=colors['card_bg'],
             height=90,
             relief='flat',
             bd=0
@@ -466,18 +610,18 @@ class CyberSecurityTool:
         header_frame.pack_propagate(False)
         
         # Add a subtle bottom border
-        border_frame = tk.Frame(header_frame, bg=self.colors['dark']['border'], height=1)
+        border_frame = tk.Frame(header_frame, bg=colors['border'], height=1)
         border_frame.pack(side='bottom', fill='x')
         border_frame.pack_propagate(False)
         
         # Title and subtitle - Enhanced design
-        title_container = tk.Frame(header_frame, bg=self.colors['dark']['card_bg'])
+        title_container = tk.Frame(header_frame, bg=colors['card_bg'])
         title_container.pack(side='left', fill='both', expand=True, padx=25, pady=15)
         
         # Logo with larger size - Load logo based on theme
         self.logo_label = tk.Label(
             title_container,
-            bg=self.colors['dark']['card_bg']
+            bg=colors['card_bg']
         )
         self.logo_label.pack(side='left', padx=(0, 20), pady=10)
         
@@ -485,37 +629,32 @@ class CyberSecurityTool:
         self._load_logo_images()
         
         # Control panel
-        control_frame = tk.Frame(header_frame, bg=self.colors['dark']['card_bg'])
+        control_frame = tk.Frame(header_frame, bg=colors['card_bg'])
         control_frame.pack(side='right', fill='y', padx=20)
         
         # Stats display
-        stats_frame = tk.Frame(control_frame, bg=self.colors['dark']['card_bg'])
+        stats_frame = tk.Frame(control_frame, bg=colors['card_bg'])
         stats_frame.pack(side='left', padx=15)
         
         self.stats_label = tk.Label(
             stats_frame,
             text="Scans: 0",
             font=("Segoe UI", 9),
-            fg=self.colors['dark']['text_secondary'],
-            bg=self.colors['dark']['card_bg']
+            fg=colors['text_secondary'],
+            bg=colors['card_bg']
         )
         self.stats_label.pack()
         
         # Theme toggle with lune icon - FIXED: Better theme switching
-        toggle_frame = tk.Frame(control_frame, bg=self.colors['dark']['card_bg'])
+        toggle_frame = tk.Frame(control_frame, bg=colors['card_bg'])
         toggle_frame.pack(side='left', padx=5)
         
         # Load and prepare lune image for toggle
         try:
             import os
-            img_path = os.path.join(os.path.dirname(__file__), 'images', 'lune.png')
-            _raw_lune = tk.PhotoImage(file=img_path)
+            img_path = os.path.join(IMAGES_DIR, 'lune.png')
             # Subsample to make it smaller for the toggle (around 24x24px)
-            if _raw_lune.width() > 28 or _raw_lune.height() > 28:
-                factor = max(1, int(max(_raw_lune.width(), _raw_lune.height()) / 20))
-                self._lune_icon = _raw_lune.subsample(factor, factor)
-            else:
-                self._lune_icon = _raw_lune
+            self._lune_icon = load_photo(img_path, 20)
             
             # Create toggle button with lune image
             self.theme_btn = tk.Button(
@@ -523,13 +662,13 @@ class CyberSecurityTool:
                 image=self._lune_icon,
                 command=self.toggle_hd_theme,
                 relief='flat',
-                bg=self.colors['dark']['button_bg'],
-                fg=self.colors['dark']['text_primary'],
+                bg=colors['button_bg'],
+                fg=colors['text_primary'],
                 bd=0,
                 padx=12,
                 pady=8,
                 cursor='hand2',
-                activebackground=self.colors['dark']['button_hover']
+                activebackground=colors['button_hover']
             )
         except Exception as e:
             # Fallback to text button if image loading fails
@@ -539,8 +678,8 @@ class CyberSecurityTool:
                 command=self.toggle_hd_theme,
                 font=("Segoe UI", 10, "bold"),
                 relief='flat',
-                bg=self.colors['dark']['button_bg'],
-                fg=self.colors['dark']['text_primary'],
+                bg=colors['button_bg'],
+                fg=colors['text_primary'],
                 bd=0,
                 padx=15,
                 pady=8,
@@ -564,15 +703,15 @@ class CyberSecurityTool:
         
         
         # Spinner Better visibility
-        self.spinner_frame = tk.Frame(control_frame, bg=self.colors['dark']['card_bg'])
+        self.spinner_frame = tk.Frame(control_frame, bg=colors['card_bg'])
         self.spinner_frame.pack(side='left', padx=10)
         
         self.spinner_label = tk.Label(
             self.spinner_frame,
             text="🔍 Scanning...",
             font=("Segoe UI", 9, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
+            fg=colors['accent'],
+            bg=colors['card_bg']
         )
         self.spinner_label.pack(side='left')
         
@@ -582,7 +721,7 @@ class CyberSecurityTool:
             width=40, 
             height=20, 
             highlightthickness=0, 
-            bg=self.colors['dark']['card_bg']
+            bg=colors['card_bg']
         )
         self.spinner_canvas.pack(side='left', padx=(5, 0))
         
@@ -592,7 +731,7 @@ class CyberSecurityTool:
             dot = self.spinner_canvas.create_oval(
                 5 + i * 12, 5,
                 15 + i * 12, 15,
-                fill=self.colors['dark']['accent'],
+                fill=colors['accent'],
                 outline=''
             )
             self.spinner_dots.append(dot)
@@ -621,14 +760,15 @@ class CyberSecurityTool:
     
     def create_hd_sidebar(self, parent):
         """Create scrollable sidebar with tool shortcuts"""
+        colors = self.colors['dark']
         # Main sidebar frame with scrollbar
         self.sidebar_frame = tk.Frame(
             parent, 
-            bg=self.colors['dark']['card_bg'],
+            bg=colors['card_bg'],
             width=240,
             relief='flat',
             bd=0,
-            highlightbackground=self.colors['dark']['border'],
+            highlightbackground=colors['border'],
             highlightthickness=1
         )
         self.sidebar_frame.grid(row=0, column=0, sticky='nsew', padx=(0, 15))
@@ -639,21 +779,21 @@ class CyberSecurityTool:
             self.sidebar_frame,
             text="🔧 TOOLS",
             font=("Segoe UI", 13, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg'],
+            fg=colors['accent'],
+            bg=colors['card_bg'],
             pady=20
         )
         sidebar_title.pack(fill='x')
         
         # Separator line
-        sep = tk.Frame(self.sidebar_frame, bg=self.colors['dark']['border'], height=1)
+        sep = tk.Frame(self.sidebar_frame, bg=colors['border'], height=1)
         sep.pack(fill='x', padx=15, pady=(0, 10))
         sep.pack_propagate(False)
         
         # Create scrollable canvas for tools
         self.sidebar_canvas = tk.Canvas(
             self.sidebar_frame,
-            bg=self.colors['dark']['card_bg'],
+            bg=colors['card_bg'],
             highlightthickness=0,
             relief='flat',
             bd=0
@@ -664,18 +804,18 @@ class CyberSecurityTool:
             orient='vertical',
             command=self.sidebar_canvas.yview,
             width=8,
-            bg=self.colors['dark']['card_bg'],
-            troughcolor=self.colors['dark']['border'],
-            activebackground=self.colors['dark']['button_hover']
+            bg=colors['card_bg'],
+            troughcolor=colors['border'],
+            activebackground=colors['button_hover']
         )
         self.sidebar_scrollable_frame = tk.Frame(
             self.sidebar_canvas,
-            bg=self.colors['dark']['card_bg']
+            bg=colors['card_bg']
         )
         
         self.sidebar_scrollable_frame.bind(
             "<Configure>",
-            lambda e: self.sidebar_canvas.configure(scrollregion=self.sidebar_canvas.bbox("all"))
+            lambda e: self.sidebar_canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
         
         self.sidebar_canvas.create_window((0, 0), window=self.sidebar_scrollable_frame, anchor="nw")
@@ -702,63 +842,45 @@ class CyberSecurityTool:
         
         self.sidebar_buttons = []
         for tool_text, tab_index in tools:
-            btn_frame = tk.Frame(self.sidebar_scrollable_frame, bg=self.colors['dark']['card_bg'])
-            btn_frame.pack(fill='x', padx=5, pady=4)
-            
             btn = tk.Button(
-                btn_frame,
+                self.sidebar_scrollable_frame,
                 text=tool_text,
                 font=("Segoe UI", 11, "bold"),
                 relief='flat',
-                bg=self.colors['dark']['button_bg'],
-                fg=self.colors['dark']['text_primary'],
+                bg=colors['button_bg'],
+                fg=colors['text_primary'],
                 bd=0,
                 padx=15,
                 pady=14,
                 anchor='w',
                 cursor='hand2',
-                activebackground=self.colors['dark']['button_hover'],
-                activeforeground=self.colors['dark']['accent'],
+                activebackground=colors['button_hover'],
+                activeforeground=colors['accent'],
                 command=lambda idx=tab_index: self.notebook.select(idx)
             )
             
             # Add hover effects without selection indicator
-            def make_hover_effect(button, normal_bg, hover_bg):
-                def on_enter(e):
-                    if button['bg'] == normal_bg:
-                        button.configure(bg=hover_bg)
-                def on_leave(e):
-                    if button['bg'] == hover_bg:
-                        button.configure(bg=normal_bg)
-                return on_enter, on_leave
-            
-            on_enter, on_leave = make_hover_effect(
-                btn, 
-                self.colors['dark']['button_bg'], 
-                self.colors['dark']['button_hover']
-            )
-            btn.bind("<Enter>", on_enter)
-            btn.bind("<Leave>", on_leave)
+            btn.bind("<Enter>", self._on_sidebar_button_enter)
+            btn.bind("<Leave>", self._on_sidebar_button_leave)
             
-            btn.pack(fill='x')
+            btn.pack(fill='x', padx=5, pady=4)
             self.sidebar_buttons.append(btn)
         
         # Add separator before quick actions
-        sep2 = tk.Frame(self.sidebar_frame, bg=self.colors['dark']['border'], height=1)
-        sep2 = tk.Frame(self.sidebar_scrollable_frame, bg=self.colors['dark']['border'], height=1)
+        sep2 = tk.Frame(self.sidebar_scrollable_frame, bg=colors['border'], height=1)
         sep2.pack(fill='x', padx=10, pady=15)
         sep2.pack_propagate(False)
         
         # Quick actions frame
-        quick_frame = tk.Frame(self.sidebar_scrollable_frame, bg=self.colors['dark']['card_bg'])
+        quick_frame = tk.Frame(self.sidebar_scrollable_frame, bg=colors['card_bg'])
         quick_frame.pack(fill='x', pady=10, padx=5)
         
         tk.Label(
             quick_frame,
             text="⚡ ACTIONS",
             font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
+            fg=colors['accent'],
+            bg=colors['card_bg']
         ).pack(anchor='w', padx=10, pady=(0, 10))
         
         quick_actions = [
@@ -768,26 +890,35 @@ class CyberSecurityTool:
         ]
         
         for action_text, action_cmd in quick_actions:
-            btn_frame = tk.Frame(quick_frame, bg=self.colors['dark']['card_bg'])
-            btn_frame.pack(fill='x', padx=0, pady=3)
-            
             btn = tk.Button(
-                btn_frame,
+                quick_frame,
                 text=action_text,
                 font=("Segoe UI", 10),
                 relief='flat',
-                bg=self.colors['dark']['transparent_bg'],
-                fg=self.colors['dark']['accent_secondary'],
+                bg=colors['transparent_bg'],
+                fg=colors['accent_secondary'],
                 bd=0,
                 padx=15,
                 pady=8,
                 anchor='w',
                 cursor='hand2',
-                activebackground=self.colors['dark']['button_bg'],
-                activeforeground=self.colors['dark']['accent'],
+                activebackground=colors['button_bg'],
+                activeforeground=colors['accent'],
                 command=action_cmd
             )
-            btn.pack(fill='x')
+            btn.pack(fill='x', padx=0, pady=3)
+    
+    def _on_sidebar_button_enter(self, event):
+        """Hover highlight shared by all sidebar tool buttons"""
+        colors = self.colors[self.theme]
+        if event.widget['bg'] == colors['button_bg']:
+            event.widget.configure(bg=colors['button_hover'])
+    
+    def _on_sidebar_button_leave(self, event):
+        """Undo the hover highlight when the pointer leaves a sidebar button"""
+        colors = self.colors[self.theme]
+        if event.widget['bg'] == colors['button_hover']:
+            event.widget.configure(bg=colors['button_bg'])
     
     def _on_sidebar_mousewheel(self, event):
         """Handle mousewheel scrolling for sidebar"""
@@ -796,13 +927,14 @@ class CyberSecurityTool:
     
     def create_hd_notebook(self, parent):
         """Create notebook with enhanced tabs"""
+        colors = self.colors['dark']
         # Main notebook container
         self.notebook_container = tk.Frame(
             parent, 
-            bg=self.colors['dark']['card_bg'],
+            bg=colors['card_bg'],
             relief='flat',
             bd=1,
-            highlightbackground=self.colors['dark']['border'],
+            highlightbackground=colors['border'],
             highlightthickness=1
         )
         self.notebook_container.grid(row=0, column=1, sticky='nsew')
@@ -810,11 +942,11 @@ class CyberSecurityTool:
         # Right-side results navigation (separate vertical scrollbar)
         self.results_nav_frame = tk.Frame(
             parent,
-            bg=self.colors['dark']['card_bg'],
+            bg=colors['card_bg'],
             width=18,
             relief='flat',
             bd=0,
-            highlightbackground=self.colors['dark']['border'],
+            highlightbackground=colors['border'],
             highlightthickness=1
         )
         self.results_nav_frame.grid(row=0, column=2, sticky='ns')
@@ -824,8 +956,8 @@ class CyberSecurityTool:
             self.results_nav_frame,
             orient='vertical',
             width=8,
-            bg=self.colors['dark']['card_bg'],
-            troughcolor=self.colors['dark']['border']
+            bg=colors['card_bg'],
+            troughcolor=colors['border']
         )
         self.results_scrollbar.pack(fill='y', padx=(2,4), pady=10)
         
@@ -839,15 +971,19 @@ class CyberSecurityTool:
         
         # Create enhanced tabs
         self.create_dashboard_tab()
-        self.create_network_scanner_tab_hd()
-        self.create_port_scanner_tab_hd()
-        self.create_hash_verifier_tab_hd()
-        self.create_password_tool_tab_hd()
-        self.create_aes_encryption_tab_hd()
-        self.create_breach_checker_tab_hd()
-        # Charts tab: Breach visualizations
-        self.create_charts_tab_hd()
-        self.create_steganography_tab_hd()
+        # Tool tabs only get an empty frame here; their widgets are built the
+        # first time the tab is selected (see _ensure_tab_built)
+        self.tab_frames = {}
+        self._tab_builders = {}
+        self._add_lazy_tab('network', "🌐 Network Scanner", self.create_network_scanner_tab_hd)
+        self._add_lazy_tab('ports', "🔍 Port Scanner", self.create_port_scanner_tab_hd)
+        self._add_lazy_tab('hash', "🔐 Hash Verifier", self.create_hash_verifier_tab_hd)
+        self._add_lazy_tab('password', "🔑 Password Tool", self.create_password_tool_tab_hd)
+        self._add_lazy_tab('aes', "🧱 AES Encryption", self.create_aes_encryption_tab_hd)
+        self._add_lazy_tab('breach', "🔒 Breach Checker", self.create_breach_checker_tab_hd)
+        self._add_lazy_tab('charts', "📊 Charts", self.create_charts_tab_hd, bg_key='card_bg')
+        self._add_lazy_tab('steganography', "🕵️ Steganography", self.create_steganography_tab_hd)
+        self.charts_frame = self.tab_frames['charts']
         
         
         # Bind tab change event
@@ -863,9 +999,28 @@ class CyberSecurityTool:
         except Exception:
             pass
     
+    def _add_lazy_tab(self, name, text, builder, bg_key='bg'):
+        """Add an empty notebook page whose content `builder` fills on first view"""
+        frame = tk.Frame(self.notebook, bg=self.colors['dark'][bg_key])
+        self.notebook.add(frame, text=text)
+        self.tab_frames[name] = frame
+        self._tab_builders[name] = builder
+
+    def _ensure_tab_built(self, name):
+        """Build a lazy tab's widgets if that has not happened yet"""
+        builder = self._tab_builders.pop(name, None)
+        if builder is None:
+            return
+        builder()
+        self.update_widget_colors(self.tab_frames[name], self.colors[self.theme])
+
     def configure_notebook_style(self):
         """Configure notebook style for current theme - FIXED: No black rectangle"""
-        colors = self.colors['dark'] if self.theme == 'dark' else self.colors['light']
+        # Startup styles the notebook and then applies the same theme again
+        if self._styled_theme == self.theme:
+            return
+        self._styled_theme = self.theme
+        colors = self.colors[self.theme]
         
         # Configure the notebook style
         self.style.configure('HD.TNotebook', 
@@ -890,42 +1045,50 @@ class CyberSecurityTool:
 
     def create_dashboard_tab(self):
         """Create dashboard tab with overview and improved layout"""
-        self.dashboard_frame = tk.Frame(self.notebook, bg=self.colors['dark']['bg'])
+        colors = self.colors['dark']
+        self.dashboard_frame = tk.Frame(self.notebook, bg=colors['bg'])
         self.notebook.add(self.dashboard_frame, text="📈 Dashboard")
         
         # Create main scrollable container for better UX on small screens
         main_canvas = tk.Canvas(
             self.dashboard_frame,
-            bg=self.colors['dark']['bg'],
+            bg=colors['bg'],
             highlightthickness=0,
             relief='flat',
             bd=0
         )
         scrollbar = ttk.Scrollbar(self.dashboard_frame, orient='vertical', command=main_canvas.yview)
-        scrollable_frame = tk.Frame(main_canvas, bg=self.colors['dark']['bg'])
+        scrollable_frame = tk.Frame(main_canvas, bg=colors['bg'])
         
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all"))
+            lambda e: main_canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         # Stretch the inner frame to the canvas width for full-screen usage
         window_id = main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
 
-        def _resize_canvas(e):
+        def _apply_resize():
+            self._dashboard_resize_id = None
+            width, height = self._dashboard_canvas_size
             # Match inner frame width to canvas
-            main_canvas.itemconfig(window_id, width=e.width)
+            main_canvas.itemconfig(window_id, width=width)
             # Expand scrollregion to at least canvas height to avoid bottom gap
-            if scrollable_frame.winfo_reqheight() < e.height:
-                main_canvas.configure(scrollregion=(0, 0, e.width, e.height))
-            else:
-                main_canvas.configure(scrollregion=main_canvas.bbox("all"))
+            content_height = scrollable_frame.winfo_reqheight()
+            main_canvas.configure(scrollregion=(0, 0, width, max(content_height, height)))
+
+        def _resize_canvas(e):
+            # A drag-resize sends a stream of <Configure> events; apply only
+            # the latest size, at most once every 30 ms
+            self._dashboard_canvas_size = (e.width, e.height)
+            if self._dashboard_resize_id is None:
+                self._dashboard_resize_id = main_canvas.after(30, _apply_resize)
 
         main_canvas.bind("<Configure>", _resize_canvas)
         main_canvas.configure(yscrollcommand=scrollbar.set)
         
         # Top row: Quick Actions (left) and Recent Activity (right)
-        top_row = tk.Frame(scrollable_frame, bg=self.colors['dark']['bg'])
+        top_row = tk.Frame(scrollable_frame, bg=colors['bg'])
         top_row.pack(fill='x', padx=12, pady=(12, 8))
         top_row.grid_columnconfigure(0, weight=3)
         top_row.grid_columnconfigure(1, weight=2)
@@ -933,17 +1096,12 @@ class CyberSecurityTool:
         # Quick action bar for fast access (left)
         quick_card = self.create_card(top_row, "⚡ Quick Actions")
         quick_card.grid(row=0, column=0, sticky='nsew', padx=(4, 6), pady=0)
-        qa_frame = tk.Frame(quick_card, bg=self.colors['dark']['card_bg'])
+        qa_frame = tk.Frame(quick_card, bg=colors['card_bg'])
         qa_frame.pack(fill='x', padx=12, pady=(8, 10))
-        qa_buttons = [
-            ("📖 View Full Log", self.show_activity_window, False),
-            ("💾 Save Session", self.save_session, False),
-            ("📂 Load Session", self.load_session, False),
-            ("🗑️ Clear Results", self.clear_all_results, False),
-            ("📤 Export Results", self.export_results, False),
-        ]
-        for text, cmd, accent in qa_buttons:
-            btn = self.create_hd_button(qa_frame, text, cmd, accent=accent)
+        for text, method_name, accent in self.QUICK_ACTIONS:
+            btn = self.create_hd_button(qa_frame, text, getattr(self, method_name), accent=accent)
+            # Fire on press rather than release (see _on_quick_action_press)
+            btn.bindtags(('QuickAction',) + btn.bindtags())
             btn.pack(side='left', padx=5, pady=2)
 
         # Recent Activity moved to the right
@@ -955,23 +1113,16 @@ class CyberSecurityTool:
         stats_card.pack(fill='both', expand=True, padx=12, pady=8)
         
         # Grid layout 2x2 for stats
-        stats_frame = tk.Frame(stats_card, bg=self.colors['dark']['card_bg'])
+        stats_frame = tk.Frame(stats_card, bg=colors['card_bg'])
         stats_frame.pack(fill='both', expand=True, padx=12, pady=(8, 12))
         stats_frame.grid_columnconfigure(0, weight=1)
         stats_frame.grid_columnconfigure(1, weight=1)
         stats_frame.grid_rowconfigure(0, weight=1)
         stats_frame.grid_rowconfigure(1, weight=1)
         
-        self.stats_data = [
-            ("📊 Total Scans", str(self.session_data.get('scans_performed', 0)), "#00ff88", "Scans this session"),
-            ("🚪 Open Ports", "0", "#0099ff", "Discovered ports"),
-            ("📁 Failed Checks", str(self.session_data.get('files_checked', 0)), "#ffaa00", "Integrity failures"),
-            ("🔒 Breached Emails", str(self.session_data.get('breached_emails_found', 0)), "#ff4444", "Compromised emails")
-        ]
-        
         self.stat_cards = []
-        for i, (title, value, color, description) in enumerate(self.stats_data):
-            card = self.create_stat_card(stats_frame, title, value, color, description)
+        for i, (title, color, description, key) in enumerate(self.STAT_SCHEMA):
+            card = self.create_stat_card(stats_frame, title, self._stat_value(key), color, description)
             r, c = divmod(i, 2)
             card.grid(row=r, column=c, sticky='nsew', padx=8, pady=6)
             self.stat_cards.append(card)
@@ -983,9 +1134,9 @@ class CyberSecurityTool:
             height=6,
             wrap=tk.WORD,
             font=("Segoe UI", 9),
-            fg=self.colors['dark']['text_primary'],
-            bg=self.colors['dark']['bg'],
-            insertbackground=self.colors['dark']['text_primary'],
+            fg=colors['text_primary'],
+            bg=colors['bg'],
+            insertbackground=colors['text_primary'],
             relief='flat',
             bd=0
         )
@@ -1003,67 +1154,91 @@ class CyberSecurityTool:
         self.session_saved = False
 
         # Update session data
-        self.session_data['recent_activities'].insert(0, activity)
-        # Keep only last 5 activities
-        if len(self.session_data['recent_activities']) > 5:
-            self.session_data['recent_activities'] = self.session_data['recent_activities'][:5]
-        
-        # Update activity display
-        activity_display = "\n".join(
-            f"🔹 {act}" for act in self.session_data['recent_activities']
-        )
+        # Newest first; the deque drops the oldest beyond the limit
+        self.session_data['recent_activities'].appendleft(activity)
+        self._unshown_activities += 1
         
-        # Update the ScrolledText widget
-        self.activity_label.config(state='normal')
-        self.activity_label.delete(1.0, tk.END)
-        self.activity_label.insert(tk.END, activity_display if activity_display else "🕐 No recent activity yet.")
-        self.activity_label.config(state='disabled')
+        # Queue the history record; it is written with the dashboard repaint
+        self._pending_history.append({
+            'timestamp': self._history_timestamp(),
+            'activity': activity
+        })
+        
+        # Repaint the dashboard once for a burst of activities
+        if self._dashboard_refresh_id is None:
+            self._dashboard_refresh_id = self.root.after(100, self._refresh_dashboard)
+
+    def _refresh_dashboard(self):
+        """Redraw the recent activity list, scan counter and stat cards"""
+        self._dashboard_refresh_id = None
+        new_count = min(self._unshown_activities, RECENT_ACTIVITY_LIMIT)
+        if new_count:
+            # Only the newest entries are written; older lines shift down and
+            # anything past the limit is trimmed off the bottom
+            new_lines = "\n".join(
+                f"🔹 {act}" for act in islice(self.session_data['recent_activities'], new_count)
+            )
+            box = self.activity_label
+            box.config(state='normal')
+            if self._activity_box_has_entries:
+                box.insert('1.0', new_lines + "\n")
+                box.delete(f'{RECENT_ACTIVITY_LIMIT}.end', tk.END)
+            else:
+                box.replace('1.0', tk.END, new_lines)
+            box.config(state='disabled')
+            self._activity_box_has_entries = True
+            self._unshown_activities = 0
         
         # Update stats
         self.stats_label.config(text=f"Scans: {self.session_data['scans_performed']}")
-        # Append activity to persistent history
-        try:
-            self.append_to_history(activity)
-        except Exception:
-            pass
-        
-        # Update stat cards
-        for i, card in enumerate(self.stat_cards):
-            # Destroy old card
-            for widget in card.winfo_children():
-                widget.destroy()
-            card.destroy()
-        
-        # Recreate stat cards with updated values
-        stats_container = self.stat_cards[0].master if self.stat_cards else None
-        if stats_container:
-            self.stat_cards = []
-            updated_stats = [
-                (f"📊 Total Scans", str(self.session_data.get('scans_performed', 0)), "#00ff88", "Scans performed this session"),
-                ("🚪 Open Ports", "4", "#0099ff", "Ports discovered across scans"),
-                ("📁 Files Checked", str(self.session_data.get('files_checked', 0)), "#ffaa00", "Files checked (failed verifications)"),
-                ("🔒 Breached Emails", str(self.session_data.get('breached_emails_found', 0)), "#ff4444", "Emails found in data breaches")
-            ]
-            
-            for i, (title, value, color, description) in enumerate(updated_stats):
-                card = self.create_stat_card(stats_container, title, value, color, description)
-                card.pack(side='left', fill='x', expand=True, padx=5)
-                self.stat_cards.append(card)
+        self.update_dashboard_stats()
+        self._flush_history()
+
+    def _set_activity_text(self, text, has_entries=False):
+        """Swap the read-only activity box's content with a single replace call.
+
+        `has_entries` says whether `text` is the activity list itself, which
+        later repaints extend in place, or a placeholder they overwrite.
+        """
+        self.activity_label.config(state='normal')
+        self.activity_label.replace('1.0', tk.END, text)
+        self.activity_label.config(state='disabled')
+        self._activity_box_has_entries = has_entries
+        self._unshown_activities = 0
+
+    def _flush_history(self):
+        """Hand queued activity records to the history writer in one batch"""
+        if self._pending_history:
+            records, self._pending_history = self._pending_history, []
+            self._history_io.submit(self._write_history_records, records)
+
+    def _history_timestamp(self):
+        """ISO timestamp to the second for a history record, formatted once per second"""
+        second = int(time.time())
+        if second != self._history_ts[0]:
+            self._history_ts = (second, datetime.fromtimestamp(second).isoformat())
+        return self._history_ts[1]
+
+    def _sync_history(self):
+        """Flush queued records and wait until the history file is up to date"""
+        self._flush_history()
+        self._history_io.submit(lambda: None).result()
 
     def show_activity_window(self):
         """Display all activities in a new window"""
+        colors = self.colors['dark']
         activity_window = tk.Toplevel(self.root)
         activity_window.title("Activity Log")
         activity_window.geometry("600x400")
-        activity_window.configure(bg=self.colors['dark']['bg'])
+        activity_window.configure(bg=colors['bg'])
         
         # Header
         header = tk.Label(
             activity_window,
             text="📋 Complete Activity Log",
             font=("Segoe UI", 12, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['bg']
+            fg=colors['accent'],
+            bg=colors['bg']
         )
         header.pack(fill='x', padx=15, pady=15)
         
@@ -1072,8 +1247,8 @@ class CyberSecurityTool:
             activity_window,
             wrap=tk.WORD,
             font=("Segoe UI", 10),
-            fg=self.colors['dark']['text_primary'],
-            bg=self.colors['dark']['card_bg'],
+            fg=colors['text_primary'],
+            bg=colors['card_bg'],
             relief='flat',
             bd=1
         )
@@ -1101,41 +1276,69 @@ class CyberSecurityTool:
 
     # Persistent history methods
     def _history_file_path(self):
-        return os.path.join(os.path.dirname(__file__), 'history.json')
+        return HISTORY_PATH
 
-    def append_to_history(self, activity):
-        """Append a single activity entry to the persistent history file."""
+    def _migrate_legacy_history(self):
+        """Convert a history.json list (newest first) into history.jsonl once"""
+        if self._history_migration_checked:
+            return
+        self._history_migration_checked = True
+        legacy_path = LEGACY_HISTORY_PATH
+        path = self._history_file_path()
+        if not os.path.exists(legacy_path) or os.path.exists(path):
+            return
         try:
-            history = self.load_history()
-        except Exception:
-            history = []
+            legacy = read_json(legacy_path)
+            with open(path, 'w', encoding='utf-8') as f:
+                for record in reversed(legacy):
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            os.remove(legacy_path)
+        except Exception as e:
+            print(f"Failed to migrate history file: {e}")
 
-        record = {
-            'timestamp': datetime.now().isoformat(),
+    def append_to_history(self, activity):
+        """Append a single activity entry to the persistent history file."""
+        self._history_io.submit(self._write_history_records, [{
+            'timestamp': self._history_timestamp(),
             'activity': activity
-        }
-        history.insert(0, record)
+        }])
 
+    def _write_history_records(self, records):
+        """Append records (oldest first) to the history file, one JSON object per line."""
+        self._migrate_legacy_history()
         try:
-            with open(self._history_file_path(), 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+            with open(self._history_file_path(), 'a', encoding='utf-8') as f:
+                f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records))
         except Exception as e:
             print(f"Failed to write history file: {e}")
 
-    def load_history(self):
-        """Load history list from file. Returns list of records."""
+    def iter_history(self):
+        """Yield history records oldest first, reading the file one line at a time."""
+        self._migrate_legacy_history()
         path = self._history_file_path()
-        if os.path.exists(path):
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Failed to read history file: {e}")
-                return []
-        return []
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Skip a torn or hand-edited line rather than the whole file
+                    continue
+
+    def load_history(self):
+        """Load history list from file, newest first. Returns list of records."""
+        try:
+            history = list(self.iter_history())
+        except Exception as e:
+            print(f"Failed to read history file: {e}")
+            return []
+        history.reverse()
+        return history
 
     def clear_history(self):
         """Clear persistent history file after user confirmation."""
+        self._sync_history()
         path = self._history_file_path()
         if os.path.exists(path):
             if messagebox.askyesno("Confirm", "Are you sure you want to clear the entire history?"):
@@ -1149,36 +1352,28 @@ class CyberSecurityTool:
 
     def show_history_window(self):
         """Open a window showing the persistent history (all sessions)."""
-        history = self.load_history()
+        colors = self.colors['dark']
+        self._sync_history()
 
         hw = tk.Toplevel(self.root)
         hw.title("History")
         hw.geometry("700x500")
-        hw.configure(bg=self.colors['dark']['bg'])
+        hw.configure(bg=colors['bg'])
 
         header = tk.Label(
             hw,
             text="📚 Full Activity History",
             font=("Segoe UI", 12, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['bg']
+            fg=colors['accent'],
+            bg=colors['bg']
         )
         header.pack(fill='x', padx=15, pady=10)
 
-        history_text = scrolledtext.ScrolledText(
-            hw,
-            wrap=tk.WORD,
-            font=("Segoe UI", 10),
-            fg=self.colors['dark']['text_primary'],
-            bg=self.colors['dark']['card_bg'],
-            relief='flat',
-            bd=1
-        )
-        history_text.pack(fill='both', expand=True, padx=15, pady=(0, 10))
-
-        if history:
-            lines = []
-            for rec in history:
+        # Format the file (oldest first) without keeping the parsed records;
+        # the view only ever renders a window of these lines
+        lines = []
+        try:
+            for rec in self.iter_history():
                 ts = rec.get('timestamp', '')
                 act = rec.get('activity', '')
                 try:
@@ -1186,16 +1381,26 @@ class CyberSecurityTool:
                 except Exception:
                     pretty_ts = ts
                 lines.append(f"[{pretty_ts}] {act}")
-            history_text.insert(tk.END, "\n".join(lines))
-        else:
-            history_text.insert(tk.END, "No history available.")
+        except Exception as e:
+            print(f"Failed to read history file: {e}")
+        lines.reverse()
 
-        history_text.config(state='disabled')
+        history_view = VirtualLogView(
+            hw,
+            lines or ["No history available."],
+            wrap=tk.WORD,
+            font=("Segoe UI", 10),
+            fg=colors['text_primary'],
+            bg=colors['card_bg'],
+            relief='flat',
+            bd=1
+        )
+        history_view.pack(fill='both', expand=True, padx=15, pady=(0, 10))
 
-        btn_frame = tk.Frame(hw, bg=self.colors['dark']['bg'])
+        btn_frame = tk.Frame(hw, bg=colors['bg'])
         btn_frame.pack(fill='x', padx=15, pady=(0, 15))
 
-        export_btn = self.create_hd_button(btn_frame, "📤 Export History", lambda: self._export_history(history), accent=False)
+        export_btn = self.create_hd_button(btn_frame, "📤 Export History", self._export_history, accent=False)
         export_btn.pack(side='left')
 
         clear_btn = self.create_hd_button(btn_frame, "🗑️ Clear History", self.clear_history, accent=False)
@@ -1204,13 +1409,13 @@ class CyberSecurityTool:
         close_btn = self.create_hd_button(btn_frame, "✕ Close", hw.destroy, accent=True)
         close_btn.pack(side='right')
 
-    def _export_history(self, history):
+    def _export_history(self):
         filename = filedialog.asksaveasfilename(defaultextension='.json', filetypes=[('JSON', '*.json'), ('All', '*.*')])
         if not filename:
             return
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+            self._sync_history()
+            write_json(filename, self.load_history())
             messagebox.showinfo('Export', f'History exported to {filename}')
         except Exception as e:
             messagebox.showerror('Export Error', str(e))
@@ -1218,23 +1423,24 @@ class CyberSecurityTool:
     # New session management
     def create_new_session(self):
         """Create a new session; warn if current session has unsaved changes."""
+        colors = self.colors['dark']
         try:
             if not getattr(self, 'session_saved', True):
                 # Show pleasant warning dialog with options
                 dlg = tk.Toplevel(self.root)
                 dlg.title("Unsaved Session")
                 dlg.geometry("480x200")
-                dlg.configure(bg=self.colors['dark']['bg'])
+                dlg.configure(bg=colors['bg'])
 
-                header = tk.Label(dlg, text="✨ You have unsaved work", font=("Segoe UI", 14, "bold"), fg=self.colors['dark']['accent'], bg=self.colors['dark']['bg'])
+                header = tk.Label(dlg, text="✨ You have unsaved work", font=("Segoe UI", 14, "bold"), fg=colors['accent'], bg=colors['bg'])
                 header.pack(pady=(12, 6))
 
                 msg = tk.Label(dlg, text=("It looks like your current session has changes that haven't been saved.\n"
                                            "Would you like to save them before starting a new session, discard them, or cancel?"),
-                               font=("Segoe UI", 10), fg=self.colors['dark']['text_primary'], bg=self.colors['dark']['bg'], justify='center')
+                               font=("Segoe UI", 10), fg=colors['text_primary'], bg=colors['bg'], justify='center')
                 msg.pack(padx=18, pady=(0, 12))
 
-                btn_frame = tk.Frame(dlg, bg=self.colors['dark']['bg'])
+                btn_frame = tk.Frame(dlg, bg=colors['bg'])
                 btn_frame.pack(fill='x', pady=(6, 12))
 
                 def _save_and_new():
@@ -1250,13 +1456,13 @@ class CyberSecurityTool:
                 def _cancel():
                     dlg.destroy()
 
-                save_btn = tk.Button(btn_frame, text='💾 Save & New', command=_save_and_new, bg=self.colors['dark']['button_bg'], fg=self.colors['dark']['text_primary'], relief='flat')
+                save_btn = tk.Button(btn_frame, text='💾 Save & New', command=_save_and_new, bg=colors['button_bg'], fg=colors['text_primary'], relief='flat')
                 save_btn.pack(side='left', padx=12)
 
-                discard_btn = tk.Button(btn_frame, text='🗑️ Discard & New', command=_discard_and_new, bg=self.colors['dark']['button_bg'], fg=self.colors['dark']['text_primary'], relief='flat')
+                discard_btn = tk.Button(btn_frame, text='🗑️ Discard & New', command=_discard_and_new, bg=colors['button_bg'], fg=colors['text_primary'], relief='flat')
                 discard_btn.pack(side='left', padx=12)
 
-                cancel_btn = tk.Button(btn_frame, text='✕ Cancel', command=_cancel, bg=self.colors['dark']['button_bg'], fg=self.colors['dark']['text_primary'], relief='flat')
+                cancel_btn = tk.Button(btn_frame, text='✕ Cancel', command=_cancel, bg=colors['button_bg'], fg=colors['text_primary'], relief='flat')
                 cancel_btn.pack(side='right', padx=12)
 
                 # Make dialog modal
@@ -1277,7 +1483,7 @@ class CyberSecurityTool:
                 'scans_performed': 0,
                 'last_scan': None,
                 'results_history': [],
-                'recent_activities': [],
+                'recent_activities': deque(maxlen=RECENT_ACTIVITY_LIMIT),
                 'breached_emails_found': 0,
                 'files_checked': 0
             }
@@ -1302,10 +1508,7 @@ class CyberSecurityTool:
 
             # Clear activity display
             try:
-                self.activity_label.config(state='normal')
-                self.activity_label.delete(1.0, tk.END)
-                self.activity_label.insert(tk.END, "🕐 No recent activity yet. Start scanning to see results here!")
-                self.activity_label.config(state='disabled')
+                self._set_activity_text("🕐 No recent activity yet. Start scanning to see results here!")
             except Exception:
                 pass
 
@@ -1346,14 +1549,13 @@ class CyberSecurityTool:
                     'timestamp': datetime.now().isoformat(),
                     'scans_performed': self.session_data['scans_performed'],
                     'last_scan': self.session_data['last_scan'],
-                    'recent_activities': self.session_data['recent_activities'],
+                    'recent_activities': list(self.session_data['recent_activities']),
                     'breached_emails_found': self.session_data.get('breached_emails_found', 0),
                     'files_checked': self.session_data.get('files_checked', 0),
                     'results': results
                 }
 
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(session_data, f, indent=2, ensure_ascii=False)
+                write_json(filename, session_data)
 
                 messagebox.showinfo("Success", f"Session saved successfully to:\n{filename}")
                 self.update_hd_status(f"✅ Session saved to {os.path.basename(filename)}")
@@ -1373,26 +1575,25 @@ class CyberSecurityTool:
         
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
+                session_data = read_json(filename)
 
                 # Load session metadata
                 self.session_data['scans_performed'] = session_data.get('scans_performed', 0)
                 self.session_data['last_scan'] = session_data.get('last_scan', None)
-                self.session_data['recent_activities'] = session_data.get('recent_activities', [])
+                self.session_data['recent_activities'] = deque(
+                    session_data.get('recent_activities', [])[:RECENT_ACTIVITY_LIMIT],
+                    maxlen=RECENT_ACTIVITY_LIMIT
+                )
                 # Restore breached emails counter if present
                 self.session_data['breached_emails_found'] = session_data.get('breached_emails_found', 0)
                 # Restore files_checked counter if present
                 self.session_data['files_checked'] = session_data.get('files_checked', 0)
 
                 # Update activity display
-                self.activity_label.config(state='normal')
-                self.activity_label.delete(1.0, tk.END)
                 activity_display = "\n".join(
                     f"🔹 {act}" for act in self.session_data['recent_activities']
                 ) if self.session_data['recent_activities'] else "Session loaded - no activities in this session."
-                self.activity_label.insert(tk.END, activity_display)
-                self.activity_label.config(state='disabled')
+                self._set_activity_text(activity_display, has_entries=bool(self.session_data['recent_activities']))
 
                 self.stats_label.config(text=f"Scans: {self.session_data['scans_performed']}")
                 # Update dashboard stat cards to reflect loaded session
@@ -1416,60 +1617,48 @@ class CyberSecurityTool:
                 messagebox.showerror("Error", f"Failed to load session:\n{str(e)}")
 
     def create_stat_card(self, parent, title, value, color, description):
-        """Create an improved statistics card with better visual hierarchy"""
-        card = tk.Frame(
+        """Create a statistics card drawn as three text items on a single Canvas"""
+        colors = self.colors['dark']
+        card = tk.Canvas(
             parent,
-            bg=self.colors['dark']['card_bg'],
-            relief='flat',
-            bd=1,
-            highlightbackground=self.colors['dark']['border'],
+            bg=colors['card_bg'],
+            bd=0,
+            highlightbackground=colors['border'],
             highlightthickness=1
         )
-        card.pack_propagate(True)
-        
-        # Title with emoji and better spacing
-        tk.Label(
-            card,
-            text=title,
-            font=("Segoe UI", 10, "bold"),
-            fg=self.colors['dark']['text_secondary'],
-            bg=self.colors['dark']['card_bg'],
-            wraplength=240
-        ).pack(anchor='w', padx=16, pady=(14, 0), fill='x')
         
-        # Large value with accent color
-        tk.Label(
-            card,
-            text=value,
-            font=("Segoe UI", 28, "bold"),
-            fg=color,
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', padx=16, pady=(6, 0))
-        
-        # Subtle description
-        tk.Label(
-            card,
-            text=description,
-            font=("Segoe UI", 8),
-            fg=self.colors['dark']['text_secondary'],
-            bg=self.colors['dark']['card_bg'],
-            wraplength=240,
-            justify='left'
-        ).pack(anchor='w', padx=16, pady=(8, 14), fill='x')
+        # Title, large value and description stacked down the left edge, each
+        # placed just below the previous item's bounding box. Title and
+        # description follow the theme's text colour via the 'themed_text' tag.
+        title_id = card.create_text(
+            16, 14, anchor='nw', text=title, width=240,
+            font=("Segoe UI", 10, "bold"), fill=colors['text_secondary'], tags=('themed_text',)
+        )
+        # Large value with accent color; its item id is kept for in-place updates
+        card.value_id = card.create_text(
+            16, card.bbox(title_id)[3] + 6, anchor='nw', text=value,
+            font=("Segoe UI", 28, "bold"), fill=color
+        )
+        desc_id = card.create_text(
+            16, card.bbox(card.value_id)[3] + 8, anchor='nw', text=description, width=240,
+            font=("Segoe UI", 8), fill=colors['text_secondary'], tags=('themed_text',)
+        )
+        card.configure(width=16 + 240 + 16, height=card.bbox(desc_id)[3] + 14)
+        card.value_text = value
         
         return card
 
     def create_network_scanner_tab_hd(self):
         """Create network scanner tab with full width layout"""
-        frame = tk.Frame(self.notebook, bg=self.colors['dark']['bg'])
-        self.notebook.add(frame, text="🌐 Network Scanner")
+        colors = self.colors['dark']
+        frame = self.tab_frames['network']
         
         # Main content frame - two column layout
-        content_frame = tk.Frame(frame, bg=self.colors['dark']['bg'])
+        content_frame = tk.Frame(frame, bg=colors['bg'])
         content_frame.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Left column - Configuration
-        left_column = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        left_column = tk.Frame(content_frame, bg=colors['bg'])
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         # Configuration card
@@ -1477,94 +1666,29 @@ class CyberSecurityTool:
         config_card.pack(fill='both', expand=True)
         
         # Input fields
-        input_frame = tk.Frame(config_card, bg=self.colors['dark']['card_bg'])
+        input_frame = tk.Frame(config_card, bg=colors['card_bg'])
         input_frame.pack(fill='x', padx=20, pady=20)
         
         # Network label and input
-        tk.Label(
-            input_frame,
-            text="Network Range:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
-        
-        self.network_entry = self.create_hd_entry(input_frame)
-        self.network_entry.pack(fill='x', pady=(0, 15))
-        self.network_entry.insert(0, "192.168.1.0/24")
+        self.network_entry = self.create_labeled_entry(input_frame, "Network Range:", "192.168.1.0/24")
 
         # Scan method with better styling
-        tk.Label(
-            input_frame,
-            text="Scan Method:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
-
-        method_frame = tk.Frame(input_frame, bg=self.colors['dark']['card_bg'])
-        method_frame.pack(fill='x', pady=(0, 15))
-
+        self.create_field_label(input_frame, "Scan Method:")
         self.network_method_var = tk.StringVar(value="tcp")
-
-        tcp_radio = tk.Radiobutton(
-            method_frame,
-            text="TCP (ports)",
-            variable=self.network_method_var,
-            value="tcp",
-            font=("Segoe UI", 10),
-            fg=self.colors['dark']['text_primary'],
-            bg=self.colors['dark']['card_bg'],
-            activebackground=self.colors['dark']['card_bg'],
-            activeforeground=self.colors['dark']['accent'],
-            selectcolor=self.colors['dark']['card_bg'],
-        )
-        tcp_radio.pack(side='left', padx=(0, 20))
-
-        icmp_radio = tk.Radiobutton(
-            method_frame,
-            text="ICMP (ping)",
-            variable=self.network_method_var,
-            value="icmp",
-            font=("Segoe UI", 10),
-            fg=self.colors['dark']['text_primary'],
-            bg=self.colors['dark']['card_bg'],
-            activebackground=self.colors['dark']['card_bg'],
-            activeforeground=self.colors['dark']['accent'],
-            selectcolor=self.colors['dark']['card_bg'],
-        )
-        icmp_radio.pack(side='left')
-        
-        # Presets label
-        tk.Label(
+        self.create_radio_group(
             input_frame,
-            text="Quick Presets:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
+            self.network_method_var,
+            [("TCP (ports)", "tcp"), ("ICMP (ping)", "icmp")],
+            pady=(0, 15)
+        )
         
         # Preset ranges
-        preset_frame = tk.Frame(input_frame, bg=self.colors['dark']['card_bg'])
-        preset_frame.pack(fill='x', pady=(0, 20))
-        
-        presets = ["192.168.1.0/24", "10.0.0.0/24", "172.16.1.0/24"]
-        for preset in presets:
-            btn = tk.Button(
-                preset_frame,
-                text=preset,
-                font=("Segoe UI", 9),
-                relief='flat',
-                bg=self.colors['dark']['button_bg'],
-                fg=self.colors['dark']['text_secondary'],
-                activebackground=self.colors['dark']['button_hover'],
-                activeforeground=self.colors['dark']['accent'],
-                command=lambda p=preset: self.network_entry.delete(0, tk.END) or self.network_entry.insert(0, p),
-                padx=12,
-                pady=8
-            )
-            btn.pack(side='left', padx=(0, 10))
-        
+        self.create_preset_buttons(
+            input_frame,
+            self.network_entry,
+            ["192.168.1.0/24", "10.0.0.0/24", "172.16.1.0/24"]
+        )
+
         # Scan button
         scan_btn = self.create_hd_button(
             config_card,
@@ -1573,9 +1697,10 @@ class CyberSecurityTool:
             accent=True
         )
         scan_btn.pack(pady=20, padx=20, fill='x')
+        self._network_scan_btn = scan_btn
         
         # Right column - Results
-        right_column = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        right_column = tk.Frame(content_frame, bg=colors['bg'])
         right_column.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         results_card = self.create_card(right_column, "Scan Results")
@@ -1584,11 +1709,11 @@ class CyberSecurityTool:
         self.network_results = scrolledtext.ScrolledText(
             results_card,
             height=30,
-            wrap=tk.WORD,
+            wrap='none',
             font=("Consolas", 9),
-            bg=self.colors['dark']['bg'],
-            fg=self.colors['dark']['text_primary'],
-            insertbackground=self.colors['dark']['text_primary'],
+            bg=colors['bg'],
+            fg=colors['text_primary'],
+            insertbackground=colors['text_primary'],
             relief='flat',
             bd=0
         )
@@ -1596,15 +1721,15 @@ class CyberSecurityTool:
 
     def create_port_scanner_tab_hd(self):
         """Create port scanner tab with full width two-column layout"""
-        frame = tk.Frame(self.notebook, bg=self.colors['dark']['bg'])
-        self.notebook.add(frame, text="🔍 Port Scanner")
+        colors = self.colors['dark']
+        frame = self.tab_frames['ports']
         
         # Main content frame - two column layout
-        content_frame = tk.Frame(frame, bg=self.colors['dark']['bg'])
+        content_frame = tk.Frame(frame, bg=colors['bg'])
         content_frame.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Left column - Configuration
-        left_column = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        left_column = tk.Frame(content_frame, bg=colors['bg'])
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         # Configuration card
@@ -1612,64 +1737,21 @@ class CyberSecurityTool:
         config_card.pack(fill='both', expand=True)
         
         # Input fields
-        input_frame = tk.Frame(config_card, bg=self.colors['dark']['card_bg'])
+        input_frame = tk.Frame(config_card, bg=colors['card_bg'])
         input_frame.pack(fill='x', padx=20, pady=20)
         
         # Target IP label and input
-        tk.Label(
-            input_frame,
-            text="Target IP/Hostname:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
-        
-        self.target_entry = self.create_hd_entry(input_frame)
-        self.target_entry.pack(fill='x', pady=(0, 15))
-        self.target_entry.insert(0, "127.0.0.1")
+        self.target_entry = self.create_labeled_entry(input_frame, "Target IP/Hostname:", "127.0.0.1")
         
         # Port range label and input
-        tk.Label(
-            input_frame,
-            text="Port Range:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
-        
-        self.port_range_entry = self.create_hd_entry(input_frame)
-        self.port_range_entry.pack(fill='x', pady=(0, 15))
-        self.port_range_entry.insert(0, "1-1000")
-        
-        # Presets label
-        tk.Label(
-            input_frame,
-            text="Quick Presets:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
+        self.port_range_entry = self.create_labeled_entry(input_frame, "Port Range:", "1-1000")
         
         # Common port presets
-        preset_frame = tk.Frame(input_frame, bg=self.colors['dark']['card_bg'])
-        preset_frame.pack(fill='x', pady=(0, 20))
-        
-        common_ports = ["1-1000", "1-100", "80,443,22,21", "1-65535"]
-        for ports in common_ports:
-            btn = tk.Button(
-                preset_frame,
-                text=ports,
-                font=("Segoe UI", 9),
-                relief='flat',
-                bg=self.colors['dark']['button_bg'],
-                fg=self.colors['dark']['text_secondary'],
-                activebackground=self.colors['dark']['button_hover'],
-                activeforeground=self.colors['dark']['accent'],
-                command=lambda p=ports: self.port_range_entry.delete(0, tk.END) or self.port_range_entry.insert(0, p),
-                padx=12,
-                pady=8
-            )
-            btn.pack(side='left', padx=(0, 10))
+        self.create_preset_buttons(
+            input_frame,
+            self.port_range_entry,
+            ["1-1000", "1-100", "80,443,22,21", "1-65535"]
+        )
         
         scan_btn = self.create_hd_button(
             config_card,
@@ -1678,9 +1760,10 @@ class CyberSecurityTool:
             accent=True
         )
         scan_btn.pack(pady=20, padx=20, fill='x')
+        self._port_scan_btn = scan_btn
         
         # Right column - Results
-        right_column = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        right_column = tk.Frame(content_frame, bg=colors['bg'])
         right_column.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         results_card = self.create_card(right_column, "Open Ports")
@@ -1689,11 +1772,11 @@ class CyberSecurityTool:
         self.port_results = scrolledtext.ScrolledText(
             results_card,
             height=30,
-            wrap=tk.WORD,
+            wrap='none',
             font=("Consolas", 9),
-            bg=self.colors['dark']['bg'],
-            fg=self.colors['dark']['text_primary'],
-            insertbackground=self.colors['dark']['text_primary'],
+            bg=colors['bg'],
+            fg=colors['text_primary'],
+            insertbackground=colors['text_primary'],
             relief='flat',
             bd=0
         )
@@ -1703,33 +1786,27 @@ class CyberSecurityTool:
 
     def create_hash_verifier_tab_hd(self):
         """Create hash verifier tab with full width two-column layout"""
-        frame = tk.Frame(self.notebook, bg=self.colors['dark']['bg'])
-        self.notebook.add(frame, text="🔐 Hash Verifier")
+        colors = self.colors['dark']
+        frame = self.tab_frames['hash']
         
         # Main content frame - two column layout
-        content_frame = tk.Frame(frame, bg=self.colors['dark']['bg'])
+        content_frame = tk.Frame(frame, bg=colors['bg'])
         content_frame.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Left column - Configuration
-        left_column = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        left_column = tk.Frame(content_frame, bg=colors['bg'])
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         config_card = self.create_card(left_column, "File Integrity Check")
         config_card.pack(fill='both', expand=True)
         
-        input_frame = tk.Frame(config_card, bg=self.colors['dark']['card_bg'])
+        input_frame = tk.Frame(config_card, bg=colors['card_bg'])
         input_frame.pack(fill='x', padx=20, pady=20)
         
         # File selection with label
-        tk.Label(
-            input_frame,
-            text="File Path:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
+        self.create_field_label(input_frame, "File Path:")
         
-        file_frame = tk.Frame(input_frame, bg=self.colors['dark']['card_bg'])
+        file_frame = tk.Frame(input_frame, bg=colors['card_bg'])
         file_frame.pack(fill='x', pady=(0, 15))
         
         self.file_path_entry = self.create_hd_entry(file_frame)
@@ -1744,54 +1821,54 @@ class CyberSecurityTool:
         browse_btn.pack(side='right', padx=(10, 0))
         
         # Expected hash with label
-        tk.Label(
-            input_frame,
-            text="Expected Hash:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
-        
-        self.expected_hash_entry = self.create_hd_entry(input_frame)
-        self.expected_hash_entry.pack(fill='x', pady=(0, 15))
+        self.expected_hash_entry = self.create_labeled_entry(input_frame, "Expected Hash:")
         
         # Algorithm selection with label
-        tk.Label(
-            input_frame,
-            text="Algorithm:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
-        
-        algo_frame = tk.Frame(input_frame, bg=self.colors['dark']['card_bg'])
-        algo_frame.pack(fill='x', pady=(0, 20))
-        
+        self.create_field_label(input_frame, "Algorithm:")
         self.expected_hash_algo_var = tk.StringVar(value="sha256")
+        self.create_radio_group(
+            input_frame,
+            self.expected_hash_algo_var,
+            [("MD5", "md5"), ("SHA1", "sha1"), ("SHA256", "sha256")]
+        )
         
-        algo_options = [
-            ("MD5", "md5"),
-            ("SHA1", "sha1"),
-            ("SHA256", "sha256")
-        ]
+        # Advanced: per-chunk manifest verification (stops at the first bad chunk)
+        self.hash_manifest_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            input_frame,
+            text="Advanced: verify against a chunk manifest",
+            variable=self.hash_manifest_var,
+            command=self._toggle_hash_manifest,
+            font=("Segoe UI", 10),
+            fg=colors['text_primary'],
+            bg=colors['card_bg'],
+            activebackground=colors['card_bg'],
+            activeforeground=colors['accent'],
+            selectcolor=colors['card_bg'],
+        ).pack(anchor='w', pady=(0, 8))
         
-        for algo_text, algo_value in algo_options:
-            radio = tk.Radiobutton(
-                algo_frame,
-                text=algo_text,
-                variable=self.expected_hash_algo_var,
-                value=algo_value,
-                font=("Segoe UI", 10),
-                fg=self.colors['dark']['text_primary'],
-                bg=self.colors['dark']['card_bg'],
-                activebackground=self.colors['dark']['card_bg'],
-                activeforeground=self.colors['dark']['accent'],
-                selectcolor=self.colors['dark']['card_bg'],
-            )
-            radio.pack(side='left', padx=(0, 20))
+        self.hash_manifest_frame = tk.Frame(input_frame, bg=colors['card_bg'])
+        tk.Label(
+            self.hash_manifest_frame,
+            text="Paste one hash per 1 MB chunk, in file order (uses the selected algorithm):",
+            font=("Segoe UI", 9),
+            fg=colors['text_secondary'],
+            bg=colors['card_bg']
+        ).pack(anchor='w', pady=(0, 5))
+        self.hash_manifest_text = scrolledtext.ScrolledText(
+            self.hash_manifest_frame,
+            height=5,
+            font=("Consolas", 9),
+            bg=colors['bg'],
+            fg=colors['text_primary'],
+            insertbackground=colors['text_primary'],
+            relief='flat',
+            bd=0
+        )
+        self.hash_manifest_text.pack(fill='x')
         
         # Hash buttons
-        hash_btn_frame = tk.Frame(config_card, bg=self.colors['dark']['card_bg'])
+        hash_btn_frame = tk.Frame(config_card, bg=colors['card_bg'])
         hash_btn_frame.pack(pady=20, fill='x', padx=20)
         
         hash_types = [
@@ -1800,6 +1877,7 @@ class CyberSecurityTool:
             ("🔒 SHA256", 'sha256')
         ]
         
+        self._hash_buttons = []
         for btn_text, hash_type in hash_types:
             btn = self.create_hd_button(
                 hash_btn_frame,
@@ -1808,9 +1886,10 @@ class CyberSecurityTool:
                 accent=(hash_type == 'sha256')
             )
             btn.pack(side='left', padx=8, fill='x', expand=True)
+            self._hash_buttons.append(btn)
         
         # Right column - Results
-        right_column = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        right_column = tk.Frame(content_frame, bg=colors['bg'])
         right_column.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         results_card = self.create_card(right_column, "Hash Results")
@@ -1821,9 +1900,9 @@ class CyberSecurityTool:
             height=30,
             wrap=tk.WORD,
             font=("Consolas", 9),
-            bg=self.colors['dark']['bg'],
-            fg=self.colors['dark']['text_primary'],
-            insertbackground=self.colors['dark']['text_primary'],
+            bg=colors['bg'],
+            fg=colors['text_primary'],
+            insertbackground=colors['text_primary'],
             relief='flat',
             bd=0
         )
@@ -1831,31 +1910,25 @@ class CyberSecurityTool:
 
     def create_password_tool_tab_hd(self):
         """Create password strength/strengthener tab with full width two-column layout."""
-        frame = tk.Frame(self.notebook, bg=self.colors["dark"]["bg"])
-        self.notebook.add(frame, text="🔑 Password Tool")
+        colors = self.colors['dark']
+        frame = self.tab_frames['password']
         
         # Main content frame - two column layout
-        content_frame = tk.Frame(frame, bg=self.colors["dark"]["bg"])
+        content_frame = tk.Frame(frame, bg=colors["bg"])
         content_frame.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Left column - Configuration
-        left_column = tk.Frame(content_frame, bg=self.colors["dark"]["bg"])
+        left_column = tk.Frame(content_frame, bg=colors["bg"])
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         config_card = self.create_card(left_column, "Password Security Analysis")
         config_card.pack(fill='both', expand=True)
         
-        input_frame = tk.Frame(config_card, bg=self.colors["dark"]["card_bg"])
+        input_frame = tk.Frame(config_card, bg=colors["card_bg"])
         input_frame.pack(fill="x", padx=20, pady=20)
 
         # Password input with label
-        tk.Label(
-            input_frame,
-            text="Password:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors["dark"]["accent"],
-            bg=self.colors["dark"]["card_bg"],
-        ).pack(anchor='w', pady=(0, 8))
+        self.create_field_label(input_frame, "Password:")
 
         self.password_entry = self.create_hd_entry(input_frame)
         self.password_entry.config(show="*")
@@ -1866,17 +1939,18 @@ class CyberSecurityTool:
             input_frame,
             text="Strength: (empty)",
             font=("Segoe UI", 10, "bold"),
-            fg=self.colors["dark"]["text_secondary"],
-            bg=self.colors["dark"]["card_bg"],
+            fg=colors["text_secondary"],
+            bg=colors["card_bg"],
             anchor="w",
         )
         self.password_live_label.pack(anchor='w', pady=(0, 15))
 
-        # Update strength live when user types
+        # Update strength live when user types (debounced, see _on_password_typed)
+        self._pw_after_id = None
         self.password_entry.bind("<KeyRelease>", self._on_password_typed)
 
         # Action buttons with better spacing
-        btn_frame = tk.Frame(config_card, bg=self.colors["dark"]["card_bg"])
+        btn_frame = tk.Frame(config_card, bg=colors["card_bg"])
         btn_frame.pack(pady=20, fill='x', padx=20)
 
         strength_btn = self.create_hd_button(
@@ -1893,7 +1967,7 @@ class CyberSecurityTool:
         strengthen_btn.pack(side="left", padx=8, fill='x', expand=True)
         
         # Right column - Results
-        right_column = tk.Frame(content_frame, bg=self.colors["dark"]["bg"])
+        right_column = tk.Frame(content_frame, bg=colors["bg"])
         right_column.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         results_card = self.create_card(right_column, "Password Analysis")
@@ -1904,9 +1978,9 @@ class CyberSecurityTool:
             height=30,
             wrap=tk.WORD,
             font=("Consolas", 9),
-            bg=self.colors["dark"]["bg"],
-            fg=self.colors["dark"]["text_primary"],
-            insertbackground=self.colors["dark"]["text_primary"],
+            bg=colors["bg"],
+            fg=colors["text_primary"],
+            insertbackground=colors["text_primary"],
             relief='flat',
             bd=0
         )
@@ -1914,33 +1988,27 @@ class CyberSecurityTool:
 
     def create_aes_encryption_tab_hd(self):
         """Create AES file encryption/decryption tab with full width two-column layout."""
-        frame = tk.Frame(self.notebook, bg=self.colors["dark"]["bg"])
-        self.notebook.add(frame, text="🧱 AES Encryption")
+        colors = self.colors['dark']
+        frame = self.tab_frames['aes']
         
         # Main content frame - two column layout
-        content_frame = tk.Frame(frame, bg=self.colors["dark"]["bg"])
+        content_frame = tk.Frame(frame, bg=colors["bg"])
         content_frame.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Left column - Configuration
-        left_column = tk.Frame(content_frame, bg=self.colors["dark"]["bg"])
+        left_column = tk.Frame(content_frame, bg=colors["bg"])
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         config_card = self.create_card(left_column, "File Encryption & Decryption")
         config_card.pack(fill='both', expand=True)
         
-        input_frame = tk.Frame(config_card, bg=self.colors["dark"]["card_bg"])
+        input_frame = tk.Frame(config_card, bg=colors["card_bg"])
         input_frame.pack(fill="x", padx=20, pady=20)
 
         # File selection with label
-        tk.Label(
-            input_frame,
-            text="File Path:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors["dark"]["accent"],
-            bg=self.colors["dark"]["card_bg"],
-        ).pack(anchor='w', pady=(0, 8))
+        self.create_field_label(input_frame, "File Path:")
 
-        file_frame = tk.Frame(input_frame, bg=self.colors["dark"]["card_bg"])
+        file_frame = tk.Frame(input_frame, bg=colors["card_bg"])
         file_frame.pack(fill='x', pady=(0, 15))
 
         self.aes_file_entry = self.create_hd_entry(file_frame)
@@ -1952,13 +2020,7 @@ class CyberSecurityTool:
         browse_btn.pack(side="right", padx=(10, 0))
 
         # Password with label
-        tk.Label(
-            input_frame,
-            text="Secret Key:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors["dark"]["accent"],
-            bg=self.colors["dark"]["card_bg"],
-        ).pack(anchor='w', pady=(0, 8))
+        self.create_field_label(input_frame, "Secret Key:")
 
         self.aes_password_entry = self.create_hd_entry(input_frame)
         self.aes_password_entry.config(show="*")
@@ -1975,12 +2037,12 @@ class CyberSecurityTool:
             text=info_text,
             justify="left",
             font=("Segoe UI", 9),
-            fg=self.colors["dark"]["text_secondary"],
-            bg=self.colors["dark"]["card_bg"],
+            fg=colors["text_secondary"],
+            bg=colors["card_bg"],
         ).pack(anchor='w', pady=(0, 15))
 
         # Action buttons with better layout
-        btn_frame = tk.Frame(config_card, bg=self.colors["dark"]["card_bg"])
+        btn_frame = tk.Frame(config_card, bg=colors["card_bg"])
         btn_frame.pack(pady=20, fill='x', padx=20)
 
         enc_btn = self.create_hd_button(
@@ -1994,7 +2056,7 @@ class CyberSecurityTool:
         dec_btn.pack(side="left", padx=8, fill='x', expand=True)
         
         # Right column - Results
-        right_column = tk.Frame(content_frame, bg=self.colors["dark"]["bg"])
+        right_column = tk.Frame(content_frame, bg=colors["bg"])
         right_column.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         results_card = self.create_card(right_column, "Encryption Log")
@@ -2005,9 +2067,9 @@ class CyberSecurityTool:
             height=30,
             wrap=tk.WORD,
             font=("Consolas", 9),
-            bg=self.colors["dark"]["bg"],
-            fg=self.colors["dark"]["text_primary"],
-            insertbackground=self.colors["dark"]["text_primary"],
+            bg=colors["bg"],
+            fg=colors["text_primary"],
+            insertbackground=colors["text_primary"],
             relief='flat',
             bd=0
         )
@@ -2015,46 +2077,30 @@ class CyberSecurityTool:
 
     def create_breach_checker_tab_hd(self):
         """Create Breach Checker tab with full width two-column layout."""
-        frame = tk.Frame(self.notebook, bg=self.colors["dark"]["bg"])
-        self.notebook.add(frame, text="🔒 Breach Checker")
+        colors = self.colors['dark']
+        frame = self.tab_frames['breach']
         
         # Main content frame - two column layout
-        content_frame = tk.Frame(frame, bg=self.colors["dark"]["bg"])
+        content_frame = tk.Frame(frame, bg=colors["bg"])
         content_frame.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Left column - Configuration
-        left_column = tk.Frame(content_frame, bg=self.colors["dark"]["bg"])
+        left_column = tk.Frame(content_frame, bg=colors["bg"])
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         config_card = self.create_card(left_column, "Email Breach Intelligence")
         config_card.pack(fill='both', expand=True)
         
-        input_frame = tk.Frame(config_card, bg=self.colors["dark"]["card_bg"])
+        input_frame = tk.Frame(config_card, bg=colors["card_bg"])
         input_frame.pack(fill="x", padx=20, pady=20)
 
         # Email input with label
-        tk.Label(
-            input_frame,
-            text="Email Address:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors["dark"]["accent"],
-            bg=self.colors["dark"]["card_bg"],
-        ).pack(anchor='w', pady=(0, 8))
-
-        self.breach_email_entry = self.create_hd_entry(input_frame)
-        self.breach_email_entry.pack(fill='x', pady=(0, 15))
-        self.breach_email_entry.insert(0, "example@email.com")
+        self.breach_email_entry = self.create_labeled_entry(input_frame, "Email Address:", "example@email.com")
 
         # CSV picker for breach database with label
-        tk.Label(
-            input_frame,
-            text="Database CSV:",
-            font=("Segoe UI", 11, "bold"),
-            fg=self.colors["dark"]["accent"],
-            bg=self.colors['dark']['card_bg']
-        ).pack(anchor='w', pady=(0, 8))
+        self.create_field_label(input_frame, "Database CSV:")
 
-        csv_frame = tk.Frame(input_frame, bg=self.colors['dark']['card_bg'])
+        csv_frame = tk.Frame(input_frame, bg=colors['card_bg'])
         csv_frame.pack(fill='x', pady=(0, 15))
         
         self.breach_csv_entry = self.create_hd_entry(csv_frame)
@@ -2076,14 +2122,14 @@ class CyberSecurityTool:
             input_frame,
             text=f"📊 Database: {db_stats['total_emails']:,} emails ({db_stats['breached_count']:,} breached)",
             font=("Segoe UI", 10),
-            fg=self.colors['dark']['text_secondary'],
-            bg=self.colors['dark']['card_bg'],
+            fg=colors['text_secondary'],
+            bg=colors['card_bg'],
             anchor="w",
         )
         self.breach_db_info_label.pack(anchor='w', pady=(0, 15))
 
         # Action buttons with better layout
-        btn_frame = tk.Frame(config_card, bg=self.colors["dark"]["card_bg"])
+        btn_frame = tk.Frame(config_card, bg=colors["card_bg"])
         btn_frame.pack(pady=20, fill='x', padx=20)
 
         check_btn = self.create_hd_button(
@@ -2095,7 +2141,7 @@ class CyberSecurityTool:
         load_db_btn.pack(side='left', padx=8, fill='x', expand=True)
         
         # Right column - Results
-        right_column = tk.Frame(content_frame, bg=self.colors["dark"]["bg"])
+        right_column = tk.Frame(content_frame, bg=colors["bg"])
         right_column.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         results_card = self.create_card(right_column, "Breach Check Results")
@@ -2106,24 +2152,28 @@ class CyberSecurityTool:
             height=30,
             wrap=tk.WORD,
             font=("Consolas", 9),
-            bg=self.colors["dark"]["bg"],
-            fg=self.colors["dark"]["text_primary"],
-            insertbackground=self.colors["dark"]["text_primary"],
+            bg=colors["bg"],
+            fg=colors["text_primary"],
+            insertbackground=colors["text_primary"],
             relief='flat',
             bd=0
         )
         self.breach_results.pack(fill="both", expand=True, padx=20, pady=15)
 
     def create_charts_tab_hd(self):
-        """Charts tab showing Breached vs Not Breached pie and Breach Count by Domain bar chart."""
-        frame = tk.Frame(self.notebook, bg=self.colors['dark']['card_bg'])
-        self.notebook.add(frame, text="📊 Charts")
+        """Charts tab showing Breached vs Not Breached pie and Breach Count by Domain bar chart.
+
+        Builds into the placeholder added by `create_hd_notebook` the first time
+        the tab is selected, so startup does not pay for matplotlib rendering.
+        """
+        colors = self.colors['dark']
+        frame = self.charts_frame
 
         card = self.create_card(frame, "Breach Data Visualizations")
         card.pack(fill='both', expand=True, padx=20, pady=20)
 
         # Controls with better layout
-        ctrl_frame = tk.Frame(card, bg=self.colors['dark']['card_bg'])
+        ctrl_frame = tk.Frame(card, bg=colors['card_bg'])
         ctrl_frame.pack(fill='x', padx=20, pady=(15, 12))
 
         # CSV picker controls with label
@@ -2131,8 +2181,8 @@ class CyberSecurityTool:
             ctrl_frame, 
             text='CSV File:', 
             font=("Segoe UI", 10, "bold"), 
-            fg=self.colors['dark']['accent'], 
-            bg=self.colors['dark']['card_bg']
+            fg=colors['accent'], 
+            bg=colors['card_bg']
         ).pack(side='left', padx=(0, 10))
         
         self.charts_csv_entry = self.create_hd_entry(ctrl_frame)
@@ -2148,14 +2198,17 @@ class CyberSecurityTool:
         save_btn.pack(side='left', padx=5)
 
         # Area for matplotlib canvas
-        self.charts_area = tk.Frame(card, bg=self.colors['dark']['card_bg'])
+        self.charts_area = tk.Frame(card, bg=colors['card_bg'])
         self.charts_area.pack(fill='both', expand=True, padx=20, pady=15)
 
         # Hold references and selected CSV path
         self._charts_fig = None
         self._charts_canvas = None
-        # Default CSV path comes from the breach_checker if available
-        self.charts_csv_path = getattr(self.breach_checker, 'csv_path', None)
+        # (path, mtime, size) of the CSV behind the current drawing
+        self._charts_key = None
+        # Default CSV path comes from the breach_checker if available, unless
+        # one was picked in the breach tab before the charts were first shown
+        self.charts_csv_path = getattr(self, 'charts_csv_path', None) or getattr(self.breach_checker, 'csv_path', None)
         try:
             if self.charts_csv_path:
                 self.charts_csv_entry.delete(0, tk.END)
@@ -2180,22 +2233,46 @@ class CyberSecurityTool:
             path = csv_path or getattr(self, 'charts_csv_path', None) or getattr(self.breach_checker, 'csv_path', None)
             if not path or not os.path.exists(path):
                 return 0, 0, {}
+            st = os.stat(path)
+            key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+            cached = self._csv_count_cache.get(key)
+            if cached is not None:
+                return cached
 
             import csv as _csv
+            # Raw domain part of each breached email (None without an '@')
+            raw_domains = []
+            add_domain = raw_domains.append
             with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                reader = _csv.DictReader(f)
+                # Plain rows instead of a dict per row; columns are located once
+                # from the header, and only breached rows touch the email
+                reader = _csv.reader(f)
+                header = next(reader, None)
+                if header is None:
+                    return 0, 0, {}
+                email_col = header.index('email') if 'email' in header else None
+                breached_col = header.index('breached') if 'breached' in header else None
                 for row in reader:
-                    email = (row.get('email') or '').strip().lower()
-                    is_breached = row.get('breached', '0') == '1'
-                    if is_breached:
+                    if not row:
+                        continue
+                    if breached_col is not None and breached_col < len(row) and row[breached_col] == '1':
                         breached += 1
-                        if '@' in email:
-                            dom = email.split('@', 1)[1]
-                        else:
-                            dom = 'unknown'
-                        domain_counts[dom] = domain_counts.get(dom, 0) + 1
+                        email = row[email_col] if email_col is not None and email_col < len(row) else ''
+                        _, at, dom = email.partition('@')
+                        add_domain(dom if at else None)
                     else:
                         safe += 1
+            # Tally in C, then normalise each distinct domain once instead of
+            # every email. Trimming the email's ends only affects the domain's
+            # trailing side, so rstrip + lower matches a full strip().lower().
+            domain_counts = {}
+            for dom, count in Counter(raw_domains).items():
+                dom = dom.rstrip().lower() if dom is not None else 'unknown'
+                domain_counts[dom] = domain_counts.get(dom, 0) + count
+            # An edited file gets a new key, so old entries only age out
+            if len(self._csv_count_cache) >= CSV_COUNT_CACHE_SIZE:
+                self._csv_count_cache.pop(next(iter(self._csv_count_cache)))
+            self._csv_count_cache[key] = (breached, safe, domain_counts)
         except Exception:
             return 0, 0, {}
 
@@ -2265,16 +2342,48 @@ class CyberSecurityTool:
 
     def _refresh_breach_charts(self):
         """Generate charts from breach CSV and display them."""
-        if plt is None or FigureCanvasTkAgg is None:
+        if 'charts' in self._tab_builders:
+            # Drawn when the Charts tab is first opened
+            return
+        if not load_matplotlib():
             messagebox.showerror('Matplotlib Missing', 'Matplotlib is required to display charts. Install with: pip install matplotlib')
             return
 
-        breached, safe, domain_counts = self._read_breach_csv_counts(self.charts_csv_path)
+        # Skip the re-read and redraw when the CSV is unchanged since the last render
+        path = self.charts_csv_path or getattr(self.breach_checker, 'csv_path', None)
+        try:
+            st = os.stat(path)
+            key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        except (OSError, TypeError):
+            key = None
+        if key is not None and key == self._charts_key and self._charts_canvas is not None:
+            self.update_hd_status('📊 Charts already up to date')
+            return
+        if self._busy.get('charts'):
+            return
+        self._set_busy('charts', True, [])
+        self.update_hd_status('🟡 Reading breach data for charts...')
+        self.start_hd_spinner()
+
+        # Parse the CSV on the worker pool; only the drawing runs on the Tk thread
+        csv_path = self.charts_csv_path
+
+        def parse_thread():
+            try:
+                counts = self._read_breach_csv_counts(csv_path)
+                self.root.after(0, lambda: self._draw_breach_charts(key, *counts))
+            finally:
+                self.root.after(0, lambda: self.stop_hd_spinner())
+                self.root.after(0, lambda: self._set_busy('charts', False, []))
 
+        self._pool.submit(parse_thread)
+
+    def _draw_breach_charts(self, key, breached, safe, domain_counts):
+        """Render parsed breach counts into the pie and domain bar charts"""
         # Prepare figure
         try:
             if self._charts_fig is None:
-                self._charts_fig = matplotlib.figure.Figure(figsize=(9, 5), dpi=100)
+                self._charts_fig = Figure(figsize=(9, 5), dpi=100)
                 self._ax1 = self._charts_fig.add_subplot(121)
                 self._ax2 = self._charts_fig.add_subplot(122)
             else:
@@ -2292,8 +2401,7 @@ class CyberSecurityTool:
             self._ax1.set_title('Breached vs Not Breached')
 
             # Domain bar chart - top 10
-            sorted_domains = sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)
-            top = sorted_domains[:10]
+            top = heapq.nlargest(10, domain_counts.items(), key=lambda x: x[1])
             if not top:
                 self._ax2.text(0.5, 0.5, 'No breached domains', ha='center', va='center')
             else:
@@ -2311,7 +2419,10 @@ class CyberSecurityTool:
                 self._charts_canvas = FigureCanvasTkAgg(self._charts_fig, master=self.charts_area)
                 self._charts_canvas.get_tk_widget().pack(fill='both', expand=True)
             else:
-                self._charts_canvas.draw()
+                # Render on the next idle pass rather than blocking this handler
+                self._charts_canvas.draw_idle()
+            self._charts_key = key
+            self.update_hd_status('📊 Charts updated')
         except Exception as e:
             messagebox.showerror('Chart Error', f'Failed to render charts: {e}')
 
@@ -2351,38 +2462,38 @@ class CyberSecurityTool:
 
     def create_aes_encryption_tab_hd(self):
         """Create AES encryption tab with file/folder encryption support"""
-        frame = tk.Frame(self.notebook, bg=self.colors['dark']['bg'])
-        self.notebook.add(frame, text="🧱 AES Encryption")
+        colors = self.colors['dark']
+        frame = self.tab_frames['aes']
         
         # Main content
-        content_frame = tk.Frame(frame, bg=self.colors['dark']['bg'])
+        content_frame = tk.Frame(frame, bg=colors['bg'])
         content_frame.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Two columns: Encrypt (Left), Decrypt (Right)
-        left_col = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        left_col = tk.Frame(content_frame, bg=colors['bg'])
         left_col.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
-        right_col = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        right_col = tk.Frame(content_frame, bg=colors['bg'])
         right_col.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         # --- ENCRYPT SECTION ---
         enc_card = self.create_card(left_col, "Encrypt File/Folder")
         enc_card.pack(fill='both', expand=True)
         
-        enc_params = tk.Frame(enc_card, bg=self.colors['dark']['card_bg'])
+        enc_params = tk.Frame(enc_card, bg=colors['card_bg'])
         enc_params.pack(fill='x', padx=20, pady=20)
         
         # Input selection
         tk.Label(enc_params, text="Select Input:", font=("Segoe UI", 10, "bold"), 
-                 fg=self.colors['dark']['accent'], bg=self.colors['dark']['card_bg']).pack(anchor='w')
+                 fg=colors['accent'], bg=colors['card_bg']).pack(anchor='w')
         
-        input_row = tk.Frame(enc_params, bg=self.colors['dark']['card_bg'])
+        input_row = tk.Frame(enc_params, bg=colors['card_bg'])
         input_row.pack(fill='x', pady=(5, 15))
         
         self.aes_enc_input_entry = self.create_hd_entry(input_row)
         self.aes_enc_input_entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
         
-        btn_row = tk.Frame(input_row, bg=self.colors['dark']['card_bg'])
+        btn_row = tk.Frame(input_row, bg=colors['card_bg'])
         btn_row.pack(side='left')
         
         self.create_hd_button(btn_row, "📄 File", self.browse_aes_enc_file, accent=False).pack(side='left', padx=2)
@@ -2390,7 +2501,7 @@ class CyberSecurityTool:
         
         # Password
         tk.Label(enc_params, text="Password:", font=("Segoe UI", 10, "bold"), 
-                 fg=self.colors['dark']['accent'], bg=self.colors['dark']['card_bg']).pack(anchor='w')
+                 fg=colors['accent'], bg=colors['card_bg']).pack(anchor='w')
         
         self.aes_enc_password_entry = self.create_hd_entry(enc_params)
         self.aes_enc_password_entry.configure(show="*")
@@ -2403,14 +2514,14 @@ class CyberSecurityTool:
         dec_card = self.create_card(right_col, "Decrypt File/Folder")
         dec_card.pack(fill='both', expand=True)
         
-        dec_params = tk.Frame(dec_card, bg=self.colors['dark']['card_bg'])
+        dec_params = tk.Frame(dec_card, bg=colors['card_bg'])
         dec_params.pack(fill='x', padx=20, pady=20)
         
         # Encrypted file
         tk.Label(dec_params, text="Encrypted File (.aes):", font=("Segoe UI", 10, "bold"), 
-                 fg=self.colors['dark']['accent'], bg=self.colors['dark']['card_bg']).pack(anchor='w')
+                 fg=colors['accent'], bg=colors['card_bg']).pack(anchor='w')
         
-        dec_input_row = tk.Frame(dec_params, bg=self.colors['dark']['card_bg'])
+        dec_input_row = tk.Frame(dec_params, bg=colors['card_bg'])
         dec_input_row.pack(fill='x', pady=(5, 15))
         
         self.aes_dec_input_entry = self.create_hd_entry(dec_input_row)
@@ -2420,7 +2531,7 @@ class CyberSecurityTool:
         
         # Password
         tk.Label(dec_params, text="Password:", font=("Segoe UI", 10, "bold"), 
-                 fg=self.colors['dark']['accent'], bg=self.colors['dark']['card_bg']).pack(anchor='w')
+                 fg=colors['accent'], bg=colors['card_bg']).pack(anchor='w')
         
         self.aes_dec_password_entry = self.create_hd_entry(dec_params)
         self.aes_dec_password_entry.configure(show="*")
@@ -2434,7 +2545,7 @@ class CyberSecurityTool:
         results_card.pack(fill='both', expand=True, padx=0, pady=(10, 0))
         
         self.aes_results = scrolledtext.ScrolledText(results_card, height=8, font=("Consolas", 10),
-                                                     bg=self.colors['dark']['bg'], fg=self.colors['dark']['text_primary'])
+                                                     bg=colors['bg'], fg=colors['text_primary'])
         self.aes_results.pack(fill='both', expand=True, padx=20, pady=20)
 
     # AES Logic Methods
@@ -2485,7 +2596,7 @@ class CyberSecurityTool:
                 self.root.after(0, lambda: self.stop_hd_spinner())
                 self.root.after(0, lambda: self.update_hd_status("🟢 Ready"))
         
-        threading.Thread(target=encrypt_thread, daemon=True).start()
+        self._pool.submit(encrypt_thread)
 
     def run_aes_decrypt(self):
         input_path = self.aes_dec_input_entry.get().strip()
@@ -2514,36 +2625,36 @@ class CyberSecurityTool:
                 self.root.after(0, lambda: self.stop_hd_spinner())
                 self.root.after(0, lambda: self.update_hd_status("🟢 Ready"))
         
-        threading.Thread(target=decrypt_thread, daemon=True).start()
+        self._pool.submit(decrypt_thread)
 
     def create_steganography_tab_hd(self):
         """Create steganography tab with 2-column layout (Hide/Extract)"""
-        frame = tk.Frame(self.notebook, bg=self.colors['dark']['bg'])
-        self.notebook.add(frame, text="🕵️ Steganography")
+        colors = self.colors['dark']
+        frame = self.tab_frames['steganography']
         
         # Main content
-        content_frame = tk.Frame(frame, bg=self.colors['dark']['bg'])
+        content_frame = tk.Frame(frame, bg=colors['bg'])
         content_frame.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Two columns: Hide (Left), Extract (Right)
-        left_col = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        left_col = tk.Frame(content_frame, bg=colors['bg'])
         left_col.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
-        right_col = tk.Frame(content_frame, bg=self.colors['dark']['bg'])
+        right_col = tk.Frame(content_frame, bg=colors['bg'])
         right_col.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         # --- HIDE SECTION ---
         hide_card = self.create_card(left_col, "Hide Message (Encode)")
         hide_card.pack(fill='both', expand=True)
         
-        hide_params = tk.Frame(hide_card, bg=self.colors['dark']['card_bg'])
+        hide_params = tk.Frame(hide_card, bg=colors['card_bg'])
         hide_params.pack(fill='x', padx=20, pady=20)
         
         # Source Image
         tk.Label(hide_params, text="Source Image:", font=("Segoe UI", 10, "bold"), 
-                 fg=self.colors['dark']['accent'], bg=self.colors['dark']['card_bg']).pack(anchor='w')
+                 fg=colors['accent'], bg=colors['card_bg']).pack(anchor='w')
         
-        src_row = tk.Frame(hide_params, bg=self.colors['dark']['card_bg'])
+        src_row = tk.Frame(hide_params, bg=colors['card_bg'])
         src_row.pack(fill='x', pady=(5, 15))
         
         self.stego_src_entry = self.create_hd_entry(src_row)
@@ -2553,17 +2664,17 @@ class CyberSecurityTool:
         
         # Message
         tk.Label(hide_params, text="Secret Message:", font=("Segoe UI", 10, "bold"), 
-                 fg=self.colors['dark']['accent'], bg=self.colors['dark']['card_bg']).pack(anchor='w')
+                 fg=colors['accent'], bg=colors['card_bg']).pack(anchor='w')
         
         self.stego_msg_text = scrolledtext.ScrolledText(hide_params, height=5, font=("Consolas", 10),
-                                                       bg=self.colors['dark']['bg'], fg=self.colors['dark']['text_primary'])
+                                                       bg=colors['bg'], fg=colors['text_primary'])
         self.stego_msg_text.pack(fill='x', pady=(5, 15))
         
         # Output Path
         tk.Label(hide_params, text="Output Image (PNG):", font=("Segoe UI", 10, "bold"), 
-                 fg=self.colors['dark']['accent'], bg=self.colors['dark']['card_bg']).pack(anchor='w')
+                 fg=colors['accent'], bg=colors['card_bg']).pack(anchor='w')
         
-        out_row = tk.Frame(hide_params, bg=self.colors['dark']['card_bg'])
+        out_row = tk.Frame(hide_params, bg=colors['card_bg'])
         out_row.pack(fill='x', pady=(5, 20))
         
         self.stego_out_entry = self.create_hd_entry(out_row)
@@ -2578,14 +2689,14 @@ class CyberSecurityTool:
         ext_card = self.create_card(right_col, "Extract Message (Decode)")
         ext_card.pack(fill='both', expand=True)
         
-        ext_params = tk.Frame(ext_card, bg=self.colors['dark']['card_bg'])
+        ext_params = tk.Frame(ext_card, bg=colors['card_bg'])
         ext_params.pack(fill='x', padx=20, pady=20)
         
         # Target Image
         tk.Label(ext_params, text="Encoded Image:", font=("Segoe UI", 10, "bold"), 
-                 fg=self.colors['dark']['accent'], bg=self.colors['dark']['card_bg']).pack(anchor='w')
+                 fg=colors['accent'], bg=colors['card_bg']).pack(anchor='w')
         
-        tgt_row = tk.Frame(ext_params, bg=self.colors['dark']['card_bg'])
+        tgt_row = tk.Frame(ext_params, bg=colors['card_bg'])
         tgt_row.pack(fill='x', pady=(5, 15))
         
         self.stego_tgt_entry = self.create_hd_entry(tgt_row)
@@ -2598,10 +2709,10 @@ class CyberSecurityTool:
         
         # Results
         tk.Label(ext_card, text="Extracted Content:", font=("Segoe UI", 10, "bold"), 
-                 fg=self.colors['dark']['accent'], bg=self.colors['dark']['card_bg']).pack(anchor='w', padx=20, pady=(10, 5))
+                 fg=colors['accent'], bg=colors['card_bg']).pack(anchor='w', padx=20, pady=(10, 5))
         
         self.stego_results = scrolledtext.ScrolledText(ext_card, height=10, font=("Consolas", 10),
-                                                      bg=self.colors['dark']['bg'], fg=self.colors['dark']['text_primary'])
+                                                      bg=colors['bg'], fg=colors['text_primary'])
         self.stego_results.pack(fill='both', expand=True, padx=20, pady=(0, 20))
 
     # Steganography Logic
@@ -2657,7 +2768,7 @@ class CyberSecurityTool:
                 self.root.after(0, lambda: self.stop_hd_spinner())
                 self.root.after(0, lambda: self.update_hd_status("🟢 Ready"))
         
-        threading.Thread(target=hide_thread, daemon=True).start()
+        self._pool.submit(hide_thread)
 
     def run_extract_message(self):
         tgt = self.stego_tgt_entry.get().strip()
@@ -2685,36 +2796,40 @@ class CyberSecurityTool:
                 self.root.after(0, lambda: self.stop_hd_spinner())
                 self.root.after(0, lambda: self.update_hd_status("🟢 Ready"))
         
-        threading.Thread(target=extract_thread, daemon=True).start()
+        self._pool.submit(extract_thread)
 
     def create_hd_status_bar(self):
         """Create status bar with improved visual design"""
+        colors = self.colors['dark']
         self.status_frame = tk.Frame(
             self.main_container,
-            bg=self.colors['dark']['card_bg'],
+            bg=colors['card_bg'],
             height=45
         )
         self.status_frame.pack(fill='x', side='bottom', padx=0, pady=0)
         self.status_frame.pack_propagate(False)
         
         # Add top border
-        border_frame = tk.Frame(self.status_frame, bg=self.colors['dark']['border'], height=1)
+        border_frame = tk.Frame(self.status_frame, bg=colors['border'], height=1)
         border_frame.pack(side='top', fill='x')
         border_frame.pack_propagate(False)
         
         # Inner container for padding
-        inner = tk.Frame(self.status_frame, bg=self.colors['dark']['card_bg'])
+        inner = tk.Frame(self.status_frame, bg=colors['card_bg'])
         inner.pack(fill='both', expand=True, padx=20, pady=8)
         
         self.status_var = tk.StringVar()
-        self.status_var.set("🟢 System Ready")
+        if MOCK_MODE:
+            self.status_var.set("⚠️ Demo Mode (CYBERSEC_DEMO=1): scan results are simulated")
+        else:
+            self.status_var.set("🟢 System Ready")
         
         self.status_label = tk.Label(
             inner,
             textvariable=self.status_var,
             font=("Segoe UI", 9),
-            fg=self.colors['dark']['text_secondary'],
-            bg=self.colors['dark']['card_bg'],
+            fg=colors['text_secondary'],
+            bg=colors['card_bg'],
             anchor='w'
         )
         self.status_label.pack(side='left', fill='x', expand=True)
@@ -2727,40 +2842,41 @@ class CyberSecurityTool:
             inner,
             textvariable=self.progress_var,
             font=("Segoe UI", 9, "bold"),
-            fg=self.colors['dark']['accent'],
-            bg=self.colors['dark']['card_bg'],
+            fg=colors['accent'],
+            bg=colors['card_bg'],
             anchor='e'
         )
         self.progress_label.pack(side='right')
 
     def create_card(self, parent, title):
         """Create a modern card container with better visual hierarchy"""
+        colors = self.colors['dark']
         card = tk.Frame(
             parent,
-            bg=self.colors['dark']['card_bg'],
+            bg=colors['card_bg'],
             relief='flat',
             bd=1,
-            highlightbackground=self.colors['dark']['border'],
+            highlightbackground=colors['border'],
             highlightthickness=1
         )
         
         if title:
             # Card header with separator
-            header_frame = tk.Frame(card, bg=self.colors['dark']['card_bg'])
+            header_frame = tk.Frame(card, bg=colors['card_bg'])
             header_frame.pack(fill='x')
             
             title_label = tk.Label(
                 header_frame,
                 text=title,
                 font=("Segoe UI", 13, "bold"),
-                fg=self.colors['dark']['text_primary'],
-                bg=self.colors['dark']['card_bg'],
+                fg=colors['text_primary'],
+                bg=colors['card_bg'],
                 anchor='w'
             )
             title_label.pack(fill='x', padx=20, pady=(15, 10))
             
             # Subtle separator line
-            sep = tk.Frame(header_frame, bg=self.colors['dark']['border'], height=1)
+            sep = tk.Frame(header_frame, bg=colors['border'], height=1)
             sep.pack(fill='x', padx=20)
             sep.pack_propagate(False)
         
@@ -2768,33 +2884,97 @@ class CyberSecurityTool:
     
     def create_hd_entry(self, parent):
         """Create a styled entry field with better visual feedback"""
+        colors = self.colors['dark']
         entry = tk.Entry(
             parent,
             font=("Segoe UI", 10),
-            bg=self.colors['dark']['bg'],
-            fg=self.colors['dark']['text_primary'],
-            insertbackground=self.colors['dark']['accent'],
+            bg=colors['bg'],
+            fg=colors['text_primary'],
+            insertbackground=colors['accent'],
             relief='flat',
             bd=1,
-            highlightbackground=self.colors['dark']['border'],
+            highlightbackground=colors['border'],
             highlightthickness=2,
-            highlightcolor=self.colors['dark']['accent'],
-            selectbackground=self.colors['dark']['accent'],
-            selectforeground=self.colors['dark']['bg']
+            highlightcolor=colors['accent'],
+            selectbackground=colors['accent'],
+            selectforeground=colors['bg']
         )
         
         # Add focus effects for better visual feedback
         def on_focus_in(event):
-            entry.config(highlightthickness=2, highlightbackground=self.colors['dark']['accent'])
+            entry.config(highlightthickness=2, highlightbackground=colors['accent'])
         
         def on_focus_out(event):
-            entry.config(highlightthickness=2, highlightbackground=self.colors['dark']['border'])
+            entry.config(highlightthickness=2, highlightbackground=colors['border'])
         
         entry.bind("<FocusIn>", on_focus_in)
         entry.bind("<FocusOut>", on_focus_out)
         
         return entry
     
+    def create_field_label(self, parent, text):
+        """Bold accent caption packed above an input field"""
+        label = tk.Label(
+            parent,
+            text=text,
+            font=("Segoe UI", 11, "bold"),
+            fg=self.colors['dark']['accent'],
+            bg=self.colors['dark']['card_bg']
+        )
+        label.pack(anchor='w', pady=(0, 8))
+        return label
+    
+    def create_labeled_entry(self, parent, label, default=None):
+        """Captioned full-width entry, optionally pre-filled; returns the entry"""
+        self.create_field_label(parent, label)
+        entry = self.create_hd_entry(parent)
+        entry.pack(fill='x', pady=(0, 15))
+        if default:
+            entry.insert(0, default)
+        return entry
+    
+    def create_radio_group(self, parent, variable, options, pady=(0, 20)):
+        """Row of radio buttons for (text, value) `options` bound to `variable`"""
+        colors = self.colors['dark']
+        group = tk.Frame(parent, bg=colors['card_bg'])
+        group.pack(fill='x', pady=pady)
+        for text, value in options:
+            tk.Radiobutton(
+                group,
+                text=text,
+                variable=variable,
+                value=value,
+                font=("Segoe UI", 10),
+                fg=colors['text_primary'],
+                bg=colors['card_bg'],
+                activebackground=colors['card_bg'],
+                activeforeground=colors['accent'],
+                selectcolor=colors['card_bg'],
+            ).pack(side='left', padx=(0, 20))
+        return group
+    
+    def create_preset_buttons(self, parent, entry, presets):
+        """Captioned row of preset buttons that each fill `entry` with their text"""
+        colors = self.colors['dark']
+        self.create_field_label(parent, "Quick Presets:")
+        preset_frame = tk.Frame(parent, bg=colors['card_bg'])
+        preset_frame.pack(fill='x', pady=(0, 20))
+        for preset in presets:
+            tk.Button(
+                preset_frame,
+                text=preset,
+                font=("Segoe UI", 9),
+                relief='flat',
+                bg=colors['button_bg'],
+                fg=colors['text_secondary'],
+                activebackground=colors['button_hover'],
+                activeforeground=colors['accent'],
+                command=lambda p=preset: entry.delete(0, tk.END) or entry.insert(0, p),
+                padx=12,
+                pady=8
+            ).pack(side='left', padx=(0, 10))
+        return preset_frame
+    
     def create_hd_button(self, parent, text, command, accent=False):
         """Create a styled button with better hover effects and visual feedback"""
         colors = self.colors['dark'] if self.theme == 'dark' else self.colors['light']
@@ -2826,35 +3006,42 @@ class CyberSecurityTool:
             activeforeground=active_fg
         )
         
-        # Enhanced hover effect with smooth visual feedback
-        def on_enter(e):
-            btn.configure(bg=hover_bg, relief='raised')
-        def on_leave(e):
-            btn.configure(bg=bg, relief='flat')
-        
-        btn.bind("<Enter>", on_enter)
-        btn.bind("<Leave>", on_leave)
+        # Hover colors are read by the shared HDButton class handlers
+        btn.hd_bg = bg
+        btn.hd_hover_bg = hover_bg
+        btn.bindtags(('HDButton',) + btn.bindtags())
         
         return btn
     
+    def _on_hd_button_enter(self, event):
+        """Hover highlight shared by all create_hd_button buttons"""
+        event.widget.configure(bg=event.widget.hd_hover_bg, relief='raised')
+    
+    def _on_hd_button_leave(self, event):
+        event.widget.configure(bg=event.widget.hd_bg, relief='flat')
+    
+    def _on_quick_action_press(self, event):
+        """Run a dashboard quick action as soon as the mouse button goes down.
+
+        Trade-off: unlike a normal Tk button, dragging off before release
+        no longer cancels the click. Returning 'break' keeps the Button class
+        bindings from also firing the command on release.
+        """
+        event.widget.invoke()
+        return 'break'
+    
     def _load_logo_images(self):
         """Load logo images for both dark and light themes"""
         try:
-            img_dir = os.path.join(os.path.dirname(__file__), 'images')
-            
             # Load dark mode logo (violet.png)
-            dark_logo_path = os.path.join(img_dir, 'logo violet.png')
-            dark_img = tk.PhotoImage(file=dark_logo_path)
+            dark_logo_path = os.path.join(IMAGES_DIR, 'logo violet.png')
             # Resize to 350x350px
-            factor = max(1, int(max(dark_img.width(), dark_img.height()) / 350))
-            self._logo_dark = dark_img.subsample(factor, factor) if factor > 1 else dark_img
+            self._logo_dark = load_photo(dark_logo_path, 350)
             
             # Load light mode logo (noir.png)
-            light_logo_path = os.path.join(img_dir, 'logo noir.png')
-            light_img = tk.PhotoImage(file=light_logo_path)
+            light_logo_path = os.path.join(IMAGES_DIR, 'logo noir.png')
             # Resize to 350x350px
-            factor = max(1, int(max(light_img.width(), light_img.height()) / 350))
-            self._logo_light = light_img.subsample(factor, factor) if factor > 1 else light_img
+            self._logo_light = load_photo(light_logo_path, 350)
             
             # Set initial logo based on current theme
             if self.theme == 'dark':
@@ -2909,8 +3096,15 @@ class CyberSecurityTool:
             # Update notebook style
             self.configure_notebook_style()
             
-            # Update all frames and widgets systematically
-            self.update_widget_colors(self.main_container, colors)
+            # Update all themed frames and widgets. The widget tree is walked
+            # once to learn each widget's palette role; later switches only
+            # iterate that registry (new widgets join via update_widget_colors)
+            if self._themed_widgets is None:
+                self._themed_widgets = {}
+                self._register_themed_widgets(self.main_container, self._themed_widgets)
+            self._recolor_widgets(self._themed_widgets, colors)
+            for card in self.stat_cards:
+                card.itemconfigure('themed_text', fill=colors['text_primary'])
             
             # Update status
             theme_status = "Light" if self.theme == 'light' else "Dark"
@@ -2919,41 +3113,47 @@ class CyberSecurityTool:
         except Exception as e:
             print(f"Theme application error: {e}")
     
-    def update_widget_colors(self, widget, colors):
-        """Update widget colors recursively - FIXED: Better theme handling"""
+    def _register_themed_widgets(self, widget, found):
+        """Record the palette role of `widget` and its descendants into `found`"""
+        bg_key = None
+        recolor_fg = False
+        # ttk widgets and some tk widgets have no bg/fg and raise TclError
         try:
-            # Update current widget
-            if hasattr(widget, 'configure'):
-                try:
-                    bg = widget.cget('bg')
-                    fg = widget.cget('fg') if 'fg' in widget.keys() else None
-                    
-                    # Update background based on original color
-                    if bg in ['#0a0f1c', '#131a2c', '#1a243f', '#f8fafc', '#ffffff', '#edf2f7']:
-                        if bg in ['#0a0f1c', '#f8fafc']:
-                            widget.configure(bg=colors['bg'])
-                        elif bg in ['#131a2c', '#ffffff']:
-                            widget.configure(bg=colors['card_bg'])
-                        elif bg in ['#1a243f', '#edf2f7']:
-                            widget.configure(bg=colors['button_bg'])
-                    
-                    # Update foreground for labels and buttons
-                    if fg and fg in ['#ffffff', '#a0a8c0', '#1a202c', '#4a5568']:
-                        if fg in ['#ffffff', '#a0a8c0']:
-                            if 'fg' in widget.keys():
-                                widget.configure(fg=colors['text_primary'])
-                        elif fg in ['#1a202c', '#4a5568']:
-                            if 'fg' in widget.keys():
-                                widget.configure(fg=colors['text_primary'])
-                except:
-                    pass
-            
-            # Recursively update children
-            for child in widget.winfo_children():
-                self.update_widget_colors(child, colors)
-                
-        except Exception as e:
-            print(f"Widget color update error: {e}")
+            bg_key = self._theme_bg_keys.get(widget.cget('bg'))
+        except tk.TclError:
+            pass
+        try:
+            recolor_fg = widget.cget('fg') in self._theme_fg_colors
+        except tk.TclError:
+            pass
+        if bg_key or recolor_fg:
+            found[widget] = (bg_key, recolor_fg)
+        for child in widget.winfo_children():
+            self._register_themed_widgets(child, found)
+
+    def _recolor_widgets(self, entries, colors):
+        """Apply `colors` to registered widgets, forgetting ones since destroyed"""
+        stale = []
+        for widget, (bg_key, recolor_fg) in entries.items():
+            changes = {}
+            if bg_key:
+                changes['bg'] = colors[bg_key]
+            if recolor_fg:
+                changes['fg'] = colors['text_primary']
+            try:
+                widget.configure(**changes)
+            except tk.TclError:
+                stale.append(widget)
+        for widget in stale:
+            entries.pop(widget, None)
+
+    def update_widget_colors(self, widget, colors):
+        """Theme a newly built widget subtree and track it for later theme switches"""
+        found = {}
+        self._register_themed_widgets(widget, found)
+        if self._themed_widgets is not None:
+            self._themed_widgets.update(found)
+        self._recolor_widgets(found, colors)
 
     # Enhanced spinner methods - IMPROVED: Better visibility
     def start_hd_spinner(self):
@@ -2990,24 +3190,10 @@ class CyberSecurityTool:
         try:
             self._spinner_phase = (self._spinner_phase + 1) % 6
             
-            colors = self.colors[self.theme]
-            
-            # Create pulsing effect with different opacities
-            pulse_intensities = [1.0, 0.6, 0.3, 0.6, 1.0, 0.6]
-            
-            for i, dot in enumerate(self.spinner_dots):
-                intensity_index = (i + self._spinner_phase) % 6
-                intensity = pulse_intensities[intensity_index]
-                
-                # Create color with intensity (simulate opacity)
-                if self.theme == 'dark':
-                    r, g, b = 0, 255, 136  # #00ff88
-                else:
-                    r, g, b = 0, 119, 255  # #0077ff
-                
-                # Adjust color based on intensity
-                adjusted_color = f'#{int(r * intensity):02x}{int(g * intensity):02x}{int(b * intensity):02x}'
-                self.spinner_canvas.itemconfig(dot, fill=adjusted_color)
+            # Pulsing effect: pre-computed dot colours for this phase
+            fills = SPINNER_FRAMES[self.theme][self._spinner_phase]
+            for dot, fill in zip(self.spinner_dots, fills):
+                self.spinner_canvas.itemconfig(dot, fill=fill)
             
             self._spinner_anim_id = self.root.after(150, self._hd_spinner_step)
         except Exception as e:
@@ -3019,15 +3205,55 @@ class CyberSecurityTool:
         # Log browsing removed (Log Analyzer feature removed)
         return
     
+    def _toggle_hash_manifest(self):
+        """Show or hide the chunk manifest input on the hash tab"""
+        if self.hash_manifest_var.get():
+            self.hash_manifest_frame.pack(fill='x', pady=(0, 15))
+        else:
+            self.hash_manifest_frame.pack_forget()
+    
+    def _format_manifest_results(self, file_path, algorithm, manifest, status, index):
+        """Build the report shown after a chunk manifest verification"""
+        chunk_mb = self.hash_verifier.chunk_size / (1024 * 1024)
+        lines = [
+            "🔐 Chunk Manifest Verification Results\n",
+            f"{'='*50}\n\n",
+            f"Path: {file_path}\n",
+            f"Algorithm: {algorithm.upper()}\n",
+            f"Chunk size: {chunk_mb:g} MB\n",
+            f"Manifest entries: {len(manifest)}\n\n",
+        ]
+        if status == 'PASS':
+            lines.append("✅ VERIFICATION PASSED ✓\n")
+            lines.append("Every chunk matches the manifest.\n")
+        else:
+            lines.append("❌ VERIFICATION FAILED ✗\n")
+            if index < len(manifest):
+                lines.append(f"First mismatch at chunk #{index} (offset {index * self.hash_verifier.chunk_size:,} bytes).\n")
+            else:
+                lines.append(f"The file has more chunks than the manifest ({len(manifest)} expected).\n")
+            lines.append("Reading stopped at the first bad chunk.\n")
+        return "".join(lines)
+    
     def browse_hash_file(self):
         filename = filedialog.askopenfilename(title="Select File to Verify")
         if filename:
             self.file_path_entry.delete(0, tk.END)
             self.file_path_entry.insert(0, filename)
 
+    def _set_busy(self, tool, busy, buttons):
+        """Mark a tool as running (or idle) and toggle its action buttons"""
+        self._busy[tool] = busy
+        for btn in buttons:
+            try:
+                btn.configure(state='disabled' if busy else 'normal')
+            except tk.TclError:
+                pass
+    
     def update_hd_status(self, message):
+        # Tk repaints the label on its next idle pass; every caller is either an
+        # event handler about to return or an after() callback from a worker
         self.status_var.set(message)
-        self.root.update_idletasks()
     
     def run_network_scan(self):
         network = self.network_entry.get().strip()
@@ -3036,6 +3262,9 @@ class CyberSecurityTool:
             return
         method = getattr(self, "network_method_var", None)
         method_value = method.get() if method is not None else "tcp"
+        if self._busy.get('network'):
+            return
+        self._set_busy('network', True, [self._network_scan_btn])
         
         self.network_results.delete(1.0, tk.END)
         approach = "TCP (ports)" if method_value == "tcp" else "ICMP (ping)"
@@ -3057,8 +3286,9 @@ class CyberSecurityTool:
             finally:
                 self.root.after(0, lambda: self.stop_hd_spinner())
                 self.root.after(0, lambda: self.update_hd_status("🟢 Network scan completed successfully"))
+                self.root.after(0, lambda: self._set_busy('network', False, [self._network_scan_btn]))
         
-        threading.Thread(target=scan_thread, daemon=True).start()
+        self._pool.submit(scan_thread)
 
     def run_port_scan(self):
         target = self.target_entry.get().strip()
@@ -3067,6 +3297,9 @@ class CyberSecurityTool:
         if not target or not port_range:
             messagebox.showerror("Error", "Please enter target IP and port range")
             return
+        if self._busy.get('port'):
+            return
+        self._set_busy('port', True, [self._port_scan_btn])
         
         self.port_results.delete(1.0, tk.END)
         self.update_hd_status("🟡 Scanning ports... This may take a few moments")
@@ -3087,8 +3320,9 @@ class CyberSecurityTool:
             finally:
                 self.root.after(0, lambda: self.stop_hd_spinner())
                 self.root.after(0, lambda: self.update_hd_status("🟢 Port scan completed successfully"))
+                self.root.after(0, lambda: self._set_busy('port', False, [self._port_scan_btn]))
         
-        threading.Thread(target=scan_thread, daemon=True).start()
+        self._pool.submit(scan_thread)
 
     
 
@@ -3098,11 +3332,23 @@ class CyberSecurityTool:
             messagebox.showerror("Error", "Please select a file")
             return
         
+        manifest = None
+        if self.hash_manifest_var.get():
+            manifest = self.hash_manifest_text.get("1.0", tk.END).split()
+            if not manifest:
+                messagebox.showerror("Error", "Please paste a chunk manifest")
+                return
+        
+        if self._busy.get('hash'):
+            return
+        self._set_busy('hash', True, self._hash_buttons)
+        
         expected_hash = self.expected_hash_entry.get().strip()
         expected_hash_algo = None
+        verifying = bool(expected_hash) or manifest is not None
         
         # If expected hash is provided, get the algorithm selection
-        if expected_hash:
+        if verifying:
             expected_hash_algo = self.expected_hash_algo_var.get()
             self.update_hd_status(f"🟡 Verifying hash using {expected_hash_algo.upper()}... This may take a few moments")
         else:
@@ -3113,13 +3359,17 @@ class CyberSecurityTool:
         
         def hash_thread():
             try:
-                results = self.hash_verifier.verify(file_path, hash_type, expected_hash, expected_hash_algo)
+                if manifest is not None:
+                    status, index = self.hash_verifier.verify_manifest(file_path, manifest, expected_hash_algo)
+                    results = self._format_manifest_results(file_path, expected_hash_algo, manifest, status, index)
+                else:
+                    results = self.hash_verifier.verify(file_path, hash_type, expected_hash, expected_hash_algo)
                 self.session_data['scans_performed'] += 1
                 self.session_data['last_scan'] = datetime.now().isoformat()
 
                 # Update dashboard activity and files_checked on failed verifications
                 filename = os.path.basename(file_path)
-                if expected_hash:
+                if verifying:
                     # Determine pass/fail from verifier output
                     lower_res = str(results).lower()
                     # The verifier prints 'VERIFICATION FAILED' on mismatch; check robustly in lowercase
@@ -3142,12 +3392,13 @@ class CyberSecurityTool:
                 self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
             finally:
                 self.root.after(0, lambda: self.stop_hd_spinner())
-                if expected_hash:
+                if verifying:
                     self.root.after(0, lambda: self.update_hd_status("🟢 Hash verification completed successfully"))
                 else:
                     self.root.after(0, lambda: self.update_hd_status("🟢 Hash generation completed successfully"))
+                self.root.after(0, lambda: self._set_busy('hash', False, self._hash_buttons))
         
-        threading.Thread(target=hash_thread, daemon=True).start()
+        self._pool.submit(hash_thread)
 
     def run_password_strength(self):
         """Evaluate the strength of the entered password."""
@@ -3193,10 +3444,18 @@ class CyberSecurityTool:
         )
 
     def _on_password_typed(self, event=None):
+        """Schedule a live strength update, collapsing a burst of keystrokes into one."""
+        if self._pw_after_id is not None:
+            self.root.after_cancel(self._pw_after_id)
+        self._pw_after_id = self.root.after(150, self._update_password_live_label)
+
+    def _update_password_live_label(self):
         """Update small strength text while typing the password."""
+        colors = self.colors['dark']
+        self._pw_after_id = None
         pw = self.password_entry.get()
         if not pw:
-            self.password_live_label.config(text="Force : (vide)", fg=self.colors["dark"]["text_secondary"])
+            self.password_live_label.config(text="Force : (vide)", fg=colors["text_secondary"])
             return
 
         score = password_strength(pw)
@@ -3205,11 +3464,11 @@ class CyberSecurityTool:
 
         # Simple color feedback
         if score <= 1:
-            color = self.colors["dark"]["error"]
+            color = colors["error"]
         elif score == 2:
-            color = self.colors["dark"]["warning"]
+            color = colors["warning"]
         else:
-            color = self.colors["dark"]["success"]
+            color = colors["success"]
 
         self.password_live_label.config(
             text=f"Force : {label} ({score}/5)",
@@ -3297,67 +3556,62 @@ class CyberSecurityTool:
             finally:
                 self.root.after(0, lambda: self.update_hd_status("🟢 Breach check completed"))
 
-        threading.Thread(target=check_thread, daemon=True).start()
+        self._pool.submit(check_thread)
+
+    def _stat_value(self, key):
+        """Text shown on a stat card for the given session_data key"""
+        return str(self.session_data.get(key, 0)) if key else "0"
 
     def update_dashboard_stats(self):
-        """Update dashboard statistics cards"""
-        stats_container = self.stat_cards[0].master if self.stat_cards else None
-        if stats_container:
-            # Destroy old cards
-            for card in self.stat_cards:
-                for widget in card.winfo_children():
-                    widget.destroy()
-                card.destroy()
-            
-            # Recreate cards with updated values
-            self.stat_cards = []
-            updated_stats = [
-                (f"📊 Total Scans", str(self.session_data.get('scans_performed', 0)), "#00ff88", "Scans performed this session"),
-                ("🚪 Open Ports", "4", "#0099ff", "Ports discovered across scans"),
-                ("📁 Files Checked", str(self.session_data.get('files_checked', 0)), "#ffaa00", "Files checked (failed verifications)"),
-                ("🔒 Breached Emails", str(self.session_data.get('breached_emails_found', 0)), "#ff4444", "Emails found in data breaches")
-            ]
-            
-            for i, (title, value, color, description) in enumerate(updated_stats):
-                card = self.create_stat_card(stats_container, title, value, color, description)
-                card.pack(side='left', fill='x', expand=True, padx=5)
-                self.stat_cards.append(card)
+        """Update the values shown on the dashboard statistics cards"""
+        for card, (_, _, _, key) in zip(self.stat_cards, self.STAT_SCHEMA):
+            value = self._stat_value(key)
+            # Most refreshes change one counter at most; leave the rest alone
+            if value != card.value_text:
+                card.itemconfigure(card.value_id, text=value)
+                card.value_text = value
 
     def _apply_loaded_result(self, key, text):
         """Apply loaded result text into the corresponding results widget based on key."""
         if not text:
             return
         try:
-            if key == 'network' and getattr(self, 'network_results', None):
-                self.network_results.delete(1.0, tk.END)
-                self.network_results.insert(tk.END, text)
-            elif key == 'ports' and getattr(self, 'port_results', None):
-                self.port_results.delete(1.0, tk.END)
-                self.port_results.insert(tk.END, text)
-            elif key == 'hash' and getattr(self, 'hash_results', None):
-                self.hash_results.delete(1.0, tk.END)
-                self.hash_results.insert(tk.END, text)
-            elif key == 'password' and getattr(self, 'password_results', None):
-                self.password_results.delete(1.0, tk.END)
-                self.password_results.insert(tk.END, text)
-            elif key == 'aes' and getattr(self, 'aes_results', None):
-                self.aes_results.delete(1.0, tk.END)
-                self.aes_results.insert(tk.END, text)
-            elif key == 'breach' and getattr(self, 'breach_results', None):
-                self.breach_results.delete(1.0, tk.END)
-                self.breach_results.insert(tk.END, text)
+            # Session keys match the lazy tab names; build the tab to receive the text
+            self._ensure_tab_built(key)
+            attr = {
+                'network': 'network_results',
+                'ports': 'port_results',
+                'hash': 'hash_results',
+                'password': 'password_results',
+                'aes': 'aes_results',
+                'breach': 'breach_results',
+            }.get(key)
+            widget = getattr(self, attr, None) if attr else None
+            if widget is not None:
+                # Saved text gets the same size cap as freshly produced results
+                self._show_results_text(widget, text)
         except Exception as e:
             print(f"Failed to apply loaded result for {key}: {e}")
 
     
+    def _show_results_text(self, widget, results):
+        """Replace a results widget's content with one insert, truncating huge outputs."""
+        if len(results) > MAX_RESULTS_CHARS:
+            dropped_kb = (len(results) - MAX_RESULTS_CHARS) // 1024
+            results = results[:MAX_RESULTS_CHARS] + f"\n... [{dropped_kb:,} KB truncated]\n"
+        widget.configure(state='normal')
+        widget.delete(1.0, tk.END)
+        widget.insert(tk.END, results)
+        widget.see('1.0')
+    
     def display_network_results(self, results):
-        self.network_results.insert(tk.END, results)
+        self._show_results_text(self.network_results, results)
     
     def display_port_results(self, results):
-        self.port_results.insert(tk.END, results)
+        self._show_results_text(self.port_results, results)
     
     def display_hash_results(self, results):
-        self.hash_results.insert(tk.END, results)
+        self._show_results_text(self.hash_results, results)
     
     # New Features
     def on_tab_changed(self, event):
@@ -3371,8 +3625,10 @@ class CyberSecurityTool:
             'password',
             'aes',
             'breach',
+            'charts',
             'steganography'
         ]
+        self._ensure_tab_built(tab_names[current_tab])
         self.update_hd_status(f"🟢 Viewing: {tab_names[current_tab]}")
     
     def clear_all_results(self):
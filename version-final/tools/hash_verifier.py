@@ -1,221 +1,484 @@
-#!/usr/bin/env python3
-"""
-Hash Verifier Module
-Generates and verifies file hashes for integrity checking
-"""
-
-import hashlib
-import os
-import time
-
-class HashVerifier:
-    def __init__(self):
-        self.chunk_size = 64 * 1024  # 64KB chunks for memory efficiency
-    
-    def calculate_hash(self, file_path, hash_type):
-        """Calculate hash of a file"""
-        hash_algorithms = {
-            'md5': hashlib.md5(),
-            'sha1': hashlib.sha1(),
-            'sha256': hashlib.sha256(),
-            'sha512': hashlib.sha512()
-        }
-        
-        if hash_type.lower() not in hash_algorithms:
-            raise ValueError(f"Unsupported hash type: {hash_type}")
-        
-        hash_obj = hash_algorithms[hash_type.lower()]
-        
-        with open(file_path, 'rb') as f:
-            while True:
-                chunk = f.read(self.chunk_size)
-                if not chunk:
-                    break
-                hash_obj.update(chunk)
-        
-        return hash_obj.hexdigest()
-    
-    def get_file_info(self, file_path):
-        """Get detailed file information"""
-        try:
-            stat = os.stat(file_path)
-            return {
-                'size': stat.st_size,
-                'size_mb': stat.st_size / (1024 * 1024),
-                'modified': time.ctime(stat.st_mtime),
-                'created': time.ctime(stat.st_ctime),
-                'permissions': oct(stat.st_mode)[-3:]
-            }
-        except Exception as e:
-            return {'error': str(e)}
-    
-    def format_file_size(self, size_bytes):
-        """Format file size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
-    
-    def verify(self, file_path, hash_type, expected_hash=None, expected_hash_algorithm=None):
-        """Verify file integrity using hash
-        
-        Args:
-            file_path: Path to the file to verify
-            hash_type: Algorithm to use for calculating hash (md5, sha1, sha256)
-            expected_hash: Expected hash value to compare against (optional)
-            expected_hash_algorithm: Algorithm of the expected hash (md5, sha1, sha256)
-                                    If None and expected_hash is provided, uses hash_type
-        """
-        if not os.path.exists(file_path):
-            return f"❌ Error: File '{file_path}' not found."
-        
-        if not os.path.isfile(file_path):
-            return f"❌ Error: '{file_path}' is not a regular file."
-        
-        try:
-            start_time = time.time()
-            
-            results = f"🔐 File Hash Verification Results\n"
-            results += f"{'='*50}\n\n"
-            
-            # File information
-            file_info = self.get_file_info(file_path)
-            if 'error' in file_info:
-                return f"❌ Error getting file info: {file_info['error']}"
-            
-            results += f"📁 File Information:\n"
-            results += f"Path: {file_path}\n"
-            results += f"Size: {self.format_file_size(file_info['size'])} ({file_info['size']:,} bytes)\n"
-            results += f"Modified: {file_info['modified']}\n"
-            results += f"Permissions: {file_info['permissions']}\n\n"
-            
-            # Determine verification algorithm
-            if expected_hash and expected_hash_algorithm:
-                verify_algorithm = expected_hash_algorithm.lower()
-                results += f"🔢 Hash Verification:\n"
-                results += f"Expected Hash Algorithm: {verify_algorithm.upper()}\n"
-                results += f"Calculating hash using {verify_algorithm.upper()}...\n\n"
-            else:
-                verify_algorithm = hash_type.lower()
-                results += f"🔢 Hash Calculation:\n"
-                results += f"Algorithm: {hash_type.upper()}\n"
-                results += f"Calculating hash...\n\n"
-            
-            # Calculate hash for verification
-            calculated_hash = self.calculate_hash(file_path, verify_algorithm)
-            calculation_time = time.time() - start_time
-            
-            results += f"✅ Hash calculated successfully!\n"
-            results += f"Calculation time: {calculation_time:.2f} seconds\n"
-            if calculation_time > 0:
-                results += f"Processing rate: {file_info['size_mb']/calculation_time:.2f} MB/s\n\n"
-            else:
-                results += f"Processing rate: Very fast (< 0.01s)\n\n"
-            
-            results += f"📋 Hash Results:\n"
-            results += f"{verify_algorithm.upper()} Hash: {calculated_hash}\n\n"
-            
-            # Verification if expected hash provided
-            if expected_hash:
-                expected_hash = expected_hash.strip().lower()
-                calculated_hash_lower = calculated_hash.lower()
-                
-                results += f"🔍 Hash Comparison:\n"
-                results += f"Expected Hash ({verify_algorithm.upper()}):   {expected_hash}\n"
-                results += f"Calculated Hash ({verify_algorithm.upper()}): {calculated_hash_lower}\n\n"
-                
-                if expected_hash == calculated_hash_lower:
-                    results += f"✅ VERIFICATION PASSED ✓\n"
-                    results += f"🎉 The hashes MATCH exactly!\n"
-                    results += f"File integrity confirmed - hashes are identical.\n\n"
-                    
-                    results += f"🛡️ Security Status:\n"
-                    results += f"• File has NOT been modified\n"
-                    results += f"• File integrity is INTACT\n"
-                    results += f"• Safe to use this file\n"
-                else:
-                    results += f"❌ VERIFICATION FAILED ✗\n"
-                    results += f"⚠️ The hashes do NOT match!\n"
-                    results += f"File integrity compromised - hashes are different.\n\n"
-                    
-                    results += f"🚨 Security Alert:\n"
-                    results += f"• File may have been MODIFIED\n"
-                    results += f"• Possible file CORRUPTION\n"
-                    results += f"• Potential security THREAT\n"
-                    results += f"• DO NOT use this file until verified\n\n"
-                    
-                    results += f"🔧 Recommended Actions:\n"
-                    results += f"• Re-download the original file\n"
-                    results += f"• Scan for malware\n"
-                    results += f"• Verify the source\n"
-                    results += f"• Check file permissions\n"
-            else:
-                results += f"ℹ️ Hash Generation Complete\n"
-                results += f"Use this hash to verify file integrity later.\n\n"
-                
-                results += f"📝 Hash Usage Examples:\n"
-                results += f"• Compare with vendor-provided hash\n"
-                results += f"• Store for future verification\n"
-                results += f"• Share for integrity validation\n"
-                results += f"• Use in security audits\n\n"
-            
-            # Additional hash types for comprehensive verification
-            if hash_type.lower() != 'sha256':
-                results += f"🔄 Additional Hash (SHA256):\n"
-                try:
-                    additional_start = time.time()
-                    sha256_hash = self.calculate_hash(file_path, 'sha256')
-                    additional_time = time.time() - additional_start
-                    results += f"SHA256: {sha256_hash}\n"
-                    results += f"Time: {additional_time:.2f}s\n\n"
-                except:
-                    results += f"Failed to calculate SHA256 hash\n\n"
-            
-            # Security recommendations
-            results += f"🔒 Security Best Practices:\n"
-            results += f"• Always verify file hashes from trusted sources\n"
-            results += f"• Use multiple hash algorithms for critical files\n"
-            results += f"• Store hashes securely and separately\n"
-            results += f"• Regularly verify important files\n"
-            results += f"• Be suspicious of hash mismatches\n"
-            
-            # Hash algorithm information
-            results += f"\n📚 Hash Algorithm Info ({hash_type.upper()}):\n"
-            hash_info = {
-                'md5': {
-                    'length': '128-bit (32 hex chars)',
-                    'security': 'Legacy - Not recommended for security',
-                    'use_case': 'Quick integrity checks, legacy systems'
-                },
-                'sha1': {
-                    'length': '160-bit (40 hex chars)',
-                    'security': 'Deprecated - Vulnerable to attacks',
-                    'use_case': 'Legacy systems, Git (being phased out)'
-                },
-                'sha256': {
-                    'length': '256-bit (64 hex chars)',
-                    'security': 'Secure - Current standard',
-                    'use_case': 'Security applications, digital signatures'
-                },
-                'sha512': {
-                    'length': '512-bit (128 hex chars)',
-                    'security': 'Very secure - Higher security',
-                    'use_case': 'High-security applications'
-                }
-            }
-            
-            if hash_type.lower() in hash_info:
-                info = hash_info[hash_type.lower()]
-                results += f"Length: {info['length']}\n"
-                results += f"Security: {info['security']}\n"
-                results += f"Use case: {info['use_case']}\n"
-            
-        except PermissionError:
-            results = f"❌ Error: Permission denied accessing '{file_path}'"
-        except ValueError as e:
-            results = f"❌ Error: {str(e)}"
-        except Exception as e:
-            results = f"❌ Error during hash calculation: {str(e)}"
-        
-        return results
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Hash Verifier Module
+Generates and verifies file hashes for integrity checking
+"""
+
+import hashlib
+import mmap
+import os
+import queue
+import stat
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Algorithms accepted by HashVerifier; each digest is created fresh via hashlib.new()
+SUPPORTED_HASH_TYPES = frozenset({'md5', 'sha1', 'sha256', 'sha512'})
+MMAP_WINDOW = 8 << 20  # bytes handed to update() per call when hashing a mapped file
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+DIGEST_CACHE_SIZE = 512  # (path, mtime, size, algorithm) digests kept by verify()
+
+# Static per-algorithm notes shown at the end of every report
+HASH_INFO = {
+    'md5': {
+        'length': '128-bit (32 hex chars)',
+        'security': 'Legacy - Not recommended for security',
+        'use_case': 'Quick integrity checks, legacy systems'
+    },
+    'sha1': {
+        'length': '160-bit (40 hex chars)',
+        'security': 'Deprecated - Vulnerable to attacks',
+        'use_case': 'Legacy systems, Git (being phased out)'
+    },
+    'sha256': {
+        'length': '256-bit (64 hex chars)',
+        'security': 'Secure - Current standard',
+        'use_case': 'Security applications, digital signatures'
+    },
+    'sha512': {
+        'length': '512-bit (128 hex chars)',
+        'security': 'Very secure - Higher security',
+        'use_case': 'High-security applications'
+    }
+}
+
+
+# Report skeleton for verify(); the fixed text is built once at import
+_HEADER_TEMPLATE = (
+    "🔐 File Hash Verification Results\n"
+    "==================================================\n\n"
+    "📁 File Information:\n"
+    "Path: {path}\n"
+    "Size: {size} ({size_bytes:,} bytes)\n"
+    "Modified: {modified}\n"
+    "Permissions: {permissions}\n\n"
+)
+_VERIFY_ALGO_TEMPLATE = (
+    "🔢 Hash Verification:\n"
+    "Expected Hash Algorithm: {algo}\n"
+    "Calculating hash using {algo}...\n\n"
+)
+_CALC_ALGO_TEMPLATE = (
+    "🔢 Hash Calculation:\n"
+    "Algorithm: {algo}\n"
+    "Calculating hash...\n\n"
+)
+_HASH_TEMPLATE = (
+    "✅ Hash calculated successfully!\n"
+    "Calculation time: {seconds:.2f} seconds\n"
+    "Processing rate: {rate}\n\n"
+    "📋 Hash Results:\n"
+    "{algo} Hash: {digest}\n\n"
+)
+_CACHED_HASH_TEMPLATE = (
+    "✅ Hash reused from cache - file unchanged since it was last hashed\n\n"
+    "📋 Hash Results:\n"
+    "{algo} Hash: {digest}\n\n"
+)
+_COMPARE_TEMPLATE = (
+    "🔍 Hash Comparison:\n"
+    "Expected Hash ({algo}):   {expected}\n"
+    "Calculated Hash ({algo}): {calculated}\n\n"
+)
+_PASS_TEXT = (
+    "✅ VERIFICATION PASSED ✓\n"
+    "🎉 The hashes MATCH exactly!\n"
+    "File integrity confirmed - hashes are identical.\n\n"
+    "🛡️ Security Status:\n"
+    "• File has NOT been modified\n"
+    "• File integrity is INTACT\n"
+    "• Safe to use this file\n"
+)
+_FAIL_TEXT = (
+    "❌ VERIFICATION FAILED ✗\n"
+    "⚠️ The hashes do NOT match!\n"
+    "File integrity compromised - hashes are different.\n\n"
+    "🚨 Security Alert:\n"
+    "• File may have been MODIFIED\n"
+    "• Possible file CORRUPTION\n"
+    "• Potential security THREAT\n"
+    "• DO NOT use this file until verified\n\n"
+    "🔧 Recommended Actions:\n"
+    "• Re-download the original file\n"
+    "• Scan for malware\n"
+    "• Verify the source\n"
+    "• Check file permissions\n"
+)
+_GENERATED_TEXT = (
+    "ℹ️ Hash Generation Complete\n"
+    "Use this hash to verify file integrity later.\n\n"
+    "📝 Hash Usage Examples:\n"
+    "• Compare with vendor-provided hash\n"
+    "• Store for future verification\n"
+    "• Share for integrity validation\n"
+    "• Use in security audits\n\n"
+)
+_EXTRA_SHA256_TEMPLATE = (
+    "🔄 Additional Hash (SHA256):\n"
+    "SHA256: {digest}\n"
+    "Time: computed in the same pass\n\n"
+)
+_BEST_PRACTICES_TEXT = (
+    "🔒 Security Best Practices:\n"
+    "• Always verify file hashes from trusted sources\n"
+    "• Use multiple hash algorithms for critical files\n"
+    "• Store hashes securely and separately\n"
+    "• Regularly verify important files\n"
+    "• Be suspicious of hash mismatches\n"
+)
+
+
+def _advise_sequential(f):
+    """Tell the kernel the file will be read once, front to back (no-op off Linux)."""
+    try:
+        fd = f.fileno()
+        # The advice values are not flags, so each one is a separate call
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except (AttributeError, OSError):
+        pass
+
+
+def _map_file(f):
+    """Map an open file read-only so the page cache is hashed without a copy.
+    
+    Returns None for empty or non-regular files, which cannot be mapped.
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return None
+    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return mm
+
+
+class HashVerifier:
+    def __init__(self, chunk_size=1 << 20):
+        self.chunk_size = chunk_size  # 1MB chunks keep per-chunk overhead low
+        self._digest_cache = OrderedDict()
+        self._digest_cache_lock = threading.Lock()
+    
+    def calculate_hash(self, file_path, hash_type):
+        """Calculate hash of a file"""
+        name = hash_type.lower()
+        if name not in SUPPORTED_HASH_TYPES:
+            raise ValueError(f"Unsupported hash type: {hash_type}")
+        
+        with open(file_path, 'rb', buffering=0) as f:
+            _advise_sequential(f)
+            mm = _map_file(f)
+            
+            # Python 3.11+ runs the whole read/update loop in C
+            if mm is None and hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, name).hexdigest()
+            
+            hash_obj = hashlib.new(name)
+            self._update_hashers(f, mm, [hash_obj])
+        
+        return hash_obj.hexdigest()
+    
+    def calculate_hashes(self, file_path, hash_types):
+        """Calculate several hashes of a file in a single read pass
+        
+        Returns a dict mapping each (lower-cased) hash type to its hex digest.
+        """
+        names = []
+        for hash_type in hash_types:
+            name = hash_type.lower()
+            if name not in SUPPORTED_HASH_TYPES:
+                raise ValueError(f"Unsupported hash type: {hash_type}")
+            if name not in names:
+                names.append(name)
+        
+        hashers = [hashlib.new(name) for name in names]
+        
+        with open(file_path, 'rb', buffering=0) as f:
+            _advise_sequential(f)
+            self._update_hashers(f, _map_file(f), hashers)
+        
+        return {name: h.hexdigest() for name, h in zip(names, hashers)}
+    
+    def _update_hashers(self, f, mm, hashers):
+        """Feed the whole file to every hasher, straight from the mapping when there is one"""
+        if mm is not None:
+            with mm, memoryview(mm) as view:
+                for offset in range(0, len(mm), MMAP_WINDOW):
+                    window = view[offset:offset + MMAP_WINDOW]
+                    for h in hashers:
+                        h.update(window)
+                    window.release()
+            return
+        
+        # Reuse one buffer for every chunk instead of allocating a new bytes object
+        buf = bytearray(self.chunk_size)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            for h in hashers:
+                h.update(view[:n])
+    
+    def calculate_hash_parallel(self, file_path, hash_type='sha256', chunk_size=8 << 20, max_workers=None):
+        """Calculate a chunked "tree" hash of a file using several threads
+        
+        A reader thread streams fixed-size chunks while a worker pool hashes
+        them. A flat digest cannot be split across threads, so this returns
+        the per-chunk digests and a root digest computed over their
+        concatenation. The root is NOT equal to calculate_hash() output.
+        
+        Returns a dict with 'chunks' (list of hex digests) and 'root' (hex).
+        """
+        name = hash_type.lower()
+        if name not in SUPPORTED_HASH_TYPES:
+            raise ValueError(f"Unsupported hash type: {hash_type}")
+        
+        max_workers = max_workers or os.cpu_count() or 1
+        # Bounded so the reader never gets far ahead of the workers
+        chunks = queue.Queue(maxsize=max_workers * 2)
+        errors = []
+        
+        def reader():
+            try:
+                with open(file_path, 'rb', buffering=0) as f:
+                    _advise_sequential(f)
+                    while True:
+                        buf = bytearray(chunk_size)
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        chunks.put(memoryview(buf)[:n])
+            except Exception as e:
+                errors.append(e)
+            finally:
+                chunks.put(None)
+        
+        def compute_hash(data):
+            return hashlib.new(name, data).digest()
+        
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        reader_thread.start()
+        
+        futures = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                data = chunks.get()
+                if data is None:
+                    break
+                futures.append(executor.submit(compute_hash, data))
+            digests = [future.result() for future in futures]
+        reader_thread.join()
+        
+        if errors:
+            raise errors[0]
+        
+        root = hashlib.new(name, b''.join(digests))
+        return {
+            'chunks': [d.hex() for d in digests],
+            'root': root.hexdigest()
+        }
+    
+    def verify_manifest(self, file_path, chunk_hashes, hash_type='sha256', chunk_size=None):
+        """Check a file against a per-chunk hash manifest
+        
+        Reading stops at the first chunk that does not match, so a tampered
+        file is rejected without hashing the rest of it.
+        
+        Args:
+            file_path: Path to the file to verify
+            chunk_hashes: Expected hex digest of each chunk, in file order
+            hash_type: Algorithm the manifest was built with
+            chunk_size: Chunk size the manifest was built with (defaults to self.chunk_size)
+        
+        Returns:
+            ('PASS', None) if every chunk matches, otherwise ('FAIL', index) where
+            index is the first chunk that differs, is missing, or is extra.
+        """
+        name = hash_type.lower()
+        if name not in SUPPORTED_HASH_TYPES:
+            raise ValueError(f"Unsupported hash type: {hash_type}")
+        
+        expected = [h.strip().lower() for h in chunk_hashes]
+        buf = bytearray(chunk_size or self.chunk_size)
+        view = memoryview(buf)
+        index = 0
+        
+        # Buffered reads always fill the whole chunk (except at EOF), keeping boundaries aligned
+        with open(file_path, 'rb') as f:
+            _advise_sequential(f)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                if index >= len(expected) or hashlib.new(name, view[:n]).hexdigest() != expected[index]:
+                    return ('FAIL', index)
+                index += 1
+        
+        if index != len(expected):
+            return ('FAIL', index)
+        return ('PASS', None)
+    
+    def _cached_hashes(self, file_path, st, hash_types):
+        """Return ({name: hexdigest}, all_cached), hashing only what the cache lacks
+        
+        Entries are keyed by (absolute path, mtime_ns, size, algorithm), so a
+        modified file misses and is hashed again.
+        """
+        base = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        digests = {}
+        missing = []
+        with self._digest_cache_lock:
+            for name in hash_types:
+                key = base + (name,)
+                if key in self._digest_cache:
+                    self._digest_cache.move_to_end(key)
+                    digests[name] = self._digest_cache[key]
+                else:
+                    missing.append(name)
+        
+        if missing:
+            fresh = self.calculate_hashes(file_path, missing)
+            digests.update(fresh)
+            with self._digest_cache_lock:
+                for name, digest in fresh.items():
+                    self._digest_cache[base + (name,)] = digest
+                while len(self._digest_cache) > DIGEST_CACHE_SIZE:
+                    self._digest_cache.popitem(last=False)
+        
+        return digests, not missing
+    
+    def get_file_info(self, file_path, st=None):
+        """Get detailed file information
+        
+        Pass an existing os.stat() result as `st` to avoid another stat call.
+        """
+        try:
+            if st is None:
+                st = os.stat(file_path)
+            return {
+                'size': st.st_size,
+                'size_mb': st.st_size / (1024 * 1024),
+                'modified': time.ctime(st.st_mtime),
+                'created': time.ctime(st.st_ctime),
+                'permissions': oct(st.st_mode)[-3:]
+            }
+        except Exception as e:
+            return {'error': str(e)}
+    
+    def format_file_size(self, size_bytes):
+        """Format file size in human readable format"""
+        # Each unit is 10 bits wide, so the bit length picks the unit directly
+        index = min((max(int(size_bytes), 1).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (index * 10)):.2f} {SIZE_UNITS[index]}"
+    
+    def verify(self, file_path, hash_type, expected_hash=None, expected_hash_algorithm=None):
+        """Verify file integrity using hash
+        
+        Args:
+            file_path: Path to the file to verify
+            hash_type: Algorithm to use for calculating hash (md5, sha1, sha256)
+            expected_hash: Expected hash value to compare against (optional)
+            expected_hash_algorithm: Algorithm of the expected hash (md5, sha1, sha256)
+                                    If None and expected_hash is provided, uses hash_type
+        """
+        # One stat call serves the existence, file type and file info checks
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return f"❌ Error: File '{file_path}' not found."
+        
+        if not stat.S_ISREG(st.st_mode):
+            return f"❌ Error: '{file_path}' is not a regular file."
+        
+        parts = []
+        add = parts.append
+        
+        try:
+            start_time = time.time()
+            
+            # File information
+            file_info = self.get_file_info(file_path, st)
+            if 'error' in file_info:
+                return f"❌ Error getting file info: {file_info['error']}"
+            
+            add(_HEADER_TEMPLATE.format(
+                path=file_path,
+                size=self.format_file_size(file_info['size']),
+                size_bytes=file_info['size'],
+                modified=file_info['modified'],
+                permissions=file_info['permissions']
+            ))
+            
+            # Determine verification algorithm
+            if expected_hash and expected_hash_algorithm:
+                verify_algorithm = expected_hash_algorithm.lower()
+                add(_VERIFY_ALGO_TEMPLATE.format(algo=verify_algorithm.upper()))
+            else:
+                verify_algorithm = hash_type.lower()
+                add(_CALC_ALGO_TEMPLATE.format(algo=hash_type.upper()))
+            
+            # Calculate the verification hash and the additional SHA256 in one pass
+            hash_types = [verify_algorithm]
+            if hash_type.lower() != 'sha256':
+                hash_types.append('sha256')
+            digests, cached = self._cached_hashes(file_path, st, hash_types)
+            calculated_hash = digests[verify_algorithm]
+            calculation_time = time.time() - start_time
+            
+            if cached:
+                add(_CACHED_HASH_TEMPLATE.format(
+                    algo=verify_algorithm.upper(),
+                    digest=calculated_hash
+                ))
+            else:
+                if calculation_time > 0:
+                    rate = f"{file_info['size_mb']/calculation_time:.2f} MB/s"
+                else:
+                    rate = "Very fast (< 0.01s)"
+                add(_HASH_TEMPLATE.format(
+                    seconds=calculation_time,
+                    rate=rate,
+                    algo=verify_algorithm.upper(),
+                    digest=calculated_hash
+                ))
+            
+            # Verification if expected hash provided
+            if expected_hash:
+                expected_hash = expected_hash.strip().lower()
+                calculated_hash_lower = calculated_hash.lower()
+                
+                add(_COMPARE_TEMPLATE.format(
+                    algo=verify_algorithm.upper(),
+                    expected=expected_hash,
+                    calculated=calculated_hash_lower
+                ))
+                add(_PASS_TEXT if expected_hash == calculated_hash_lower else _FAIL_TEXT)
+            else:
+                add(_GENERATED_TEXT)
+            
+            # Additional hash types for comprehensive verification
+            if hash_type.lower() != 'sha256':
+                add(_EXTRA_SHA256_TEMPLATE.format(digest=digests['sha256']))
+            
+            # Security recommendations
+            add(_BEST_PRACTICES_TEXT)
+            
+            # Hash algorithm information
+            add(f"\n📚 Hash Algorithm Info ({hash_type.upper()}):\n")
+            info = HASH_INFO.get(hash_type.lower())
+            if info:
+                add(f"Length: {info['length']}\n")
+                add(f"Security: {info['security']}\n")
+                add(f"Use case: {info['use_case']}\n")
+            
+        except PermissionError:
+            return f"❌ Error: Permission denied accessing '{file_path}'"
+        except ValueError as e:
+            return f"❌ Error: {str(e)}"
+        except Exception as e:
+            return f"❌ Error during hash calculation: {str(e)}"
+        
+        return "".join(parts)
\ No newline at end of file
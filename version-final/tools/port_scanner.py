@@ -1,237 +1,313 @@
-#!/usr/bin/env python3
-"""
-Port Scanner Module
-Scans specified ports on target hosts
-"""
-
-import socket
-import threading
-import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-class PortScanner:
-    def __init__(self, timeout=3, max_threads=100):
-        self.timeout = timeout
-        self.max_threads = max_threads
-        self.open_ports = []
-        self.lock = threading.Lock()
-        
-        # Common service mappings
-        self.services = {
-            21: "FTP", 22: "SSH", 23: "Telnet", 25: "SMTP", 53: "DNS",
-            80: "HTTP", 110: "POP3", 111: "RPC", 135: "RPC", 139: "NetBIOS",
-            143: "IMAP", 443: "HTTPS", 445: "SMB", 993: "IMAPS", 995: "POP3S",
-            1433: "MSSQL", 1521: "Oracle", 3306: "MySQL", 3389: "RDP",
-            5432: "PostgreSQL", 5900: "VNC", 6379: "Redis", 8080: "HTTP-Alt",
-            8443: "HTTPS-Alt", 9200: "Elasticsearch", 27017: "MongoDB"
-        }
-    
-    def scan_port(self, target, port):
-        """Scan a single port on the target"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            result = sock.connect_ex((target, port))
-            
-            if result == 0:
-                service = self.services.get(port, "Unknown")
-                banner = self.grab_banner(sock, port)
-                
-                with self.lock:
-                    self.open_ports.append({
-                        'port': port,
-                        'service': service,
-                        'banner': banner,
-                        'state': 'Open'
-                    })
-                sock.close()
-                return True
-            else:
-                sock.close()
-                return False
-                
-        except socket.gaierror:
-            return False
-        except Exception:
-            return False
-    
-    def grab_banner(self, sock, port):
-        """Attempt to grab service banner"""
-        try:
-            if port in [21, 22, 25, 110, 143]:  # Text-based protocols
-                sock.settimeout(2)
-                banner = sock.recv(1024).decode('utf-8', 'ignore').strip()
-                return banner[:100] if banner else "No banner"
-            elif port in [80, 8080]:  # HTTP
-                sock.send(b"HEAD / HTTP/1.0\r\n\r\n")
-                sock.settimeout(2)
-                banner = sock.recv(1024).decode('utf-8', 'ignore').strip()
-                # Extract server header
-                for line in banner.split('\n'):
-                    if 'server:' in line.lower():
-                        return line.strip()[:100]
-                return "HTTP Service"
-            else:
-                return "Service detected"
-        except:
-            return "No banner"
-    
-    def parse_port_range(self, port_range):
-        """Parse port range string into list of ports"""
-        ports = []
-        
-        try:
-            if '-' in port_range:
-                start, end = map(int, port_range.split('-'))
-                if start > end or start < 1 or end > 65535:
-                    raise ValueError("Invalid port range")
-                ports = list(range(start, end + 1))
-            elif ',' in port_range:
-                ports = [int(p.strip()) for p in port_range.split(',')]
-                for port in ports:
-                    if port < 1 or port > 65535:
-                        raise ValueError("Invalid port number")
-            else:
-                port = int(port_range)
-                if port < 1 or port > 65535:
-                    raise ValueError("Invalid port number")
-                ports = [port]
-                
-        except ValueError as e:
-            if "invalid literal" in str(e):
-                raise ValueError("Invalid port format. Use: 80, 80-443, or 80,443,8080")
-            else:
-                raise e
-        
-        return ports
-    
-    def scan(self, target, port_range):
-        """Scan ports on target host"""
-        self.open_ports = []
-        start_time = time.time()
-        
-        # Check if target is localhost - use demo data for demonstration
-        is_localhost = target in ['127.0.0.1', 'localhost', '::1']
-        
-        try:
-            # Validate target
-            socket.inet_aton(target)
-        except socket.error:
-            try:
-                target = socket.gethostbyname(target)
-            except socket.gaierror:
-                return f"Error: Unable to resolve target '{target}'"
-        
-        try:
-            ports = self.parse_port_range(port_range)
-        except ValueError as e:
-            return f"Error: {str(e)}"
-        
-        if len(ports) > 10000:
-            return "Error: Port range too large (max 10,000 ports)"
-        
-        results = f"🔍 Port Scan Results for {target}\n"
-        results += f"{'='*50}\n\n"
-        results += f"Target: {target}\n"
-        results += f"Port Range: {port_range} ({len(ports)} ports)\n"
-        results += f"Scanning...\n\n"
-        
-        # Separate ports into two groups: well-known (1-1024) and high ports (1025+)
-        well_known_ports = [p for p in ports if p <= 1024]
-        high_ports = [p for p in ports if p > 1024]
-        
-        # For ports 1-1024: Do real scanning
-        if well_known_ports:
-            with ThreadPoolExecutor(max_workers=min(self.max_threads, len(well_known_ports))) as executor:
-                future_to_port = {executor.submit(self.scan_port, target, port): port for port in well_known_ports}
-                
-                completed = 0
-                for future in as_completed(future_to_port):
-                    completed += 1
-                    if completed % 50 == 0:  # Progress update
-                        results += f"Scanned {completed}/{len(well_known_ports)} well-known ports...\n"
-        
-        # For ports 1025+: Use demo data (as they're typically not open without specific services)
-        if high_ports:
-            demo_high_port_services = [
-                {'port': 8080, 'service': 'HTTP-Alt', 'banner': 'Apache httpd 2.4.41', 'state': 'Open'},
-                {'port': 8443, 'service': 'HTTPS-Alt', 'banner': 'nginx 1.18.0', 'state': 'Open'},
-                {'port': 9200, 'service': 'Elasticsearch', 'banner': 'Elasticsearch/7.14.0', 'state': 'Open'},
-                {'port': 27017, 'service': 'MongoDB', 'banner': 'MongoDB 4.4.8', 'state': 'Open'},
-                {'port': 6379, 'service': 'Redis', 'banner': 'Redis 6.2.5', 'state': 'Open'},
-            ]
-            
-            # Add demo ports that fall within the requested high port range
-            for demo_port in demo_high_port_services:
-                if demo_port['port'] in high_ports:
-                    self.open_ports.append(demo_port)
-        
-        # For localhost: If no real ports found, add demo results for education
-        if is_localhost and not self.open_ports:
-            demo_open_ports = [
-                {'port': 22, 'service': 'SSH', 'banner': 'OpenSSH 8.2p1 Ubuntu 4ubuntu0.5', 'state': 'Open'},
-                {'port': 80, 'service': 'HTTP', 'banner': 'Apache httpd 2.4.41', 'state': 'Open'},
-                {'port': 443, 'service': 'HTTPS', 'banner': 'nginx 1.18.0', 'state': 'Open'},
-                {'port': 3306, 'service': 'MySQL', 'banner': 'MySQL 8.0.28-0ubuntu0.20.04.3', 'state': 'Open'},
-                {'port': 5432, 'service': 'PostgreSQL', 'banner': 'PostgreSQL 12.9', 'state': 'Open'},
-            ]
-            
-            # Filter demo ports to match requested range
-            self.open_ports = [p for p in demo_open_ports if p['port'] in ports]
-            
-            # If still no results and ports scanned, show demo ports in range
-            if not self.open_ports and ports:
-                if any(p <= 25 for p in ports):
-                    self.open_ports.append({'port': 25, 'service': 'SMTP', 'banner': 'Postfix 3.4.8', 'state': 'Open'})
-                if any(p <= 53 for p in ports):
-                    self.open_ports.append({'port': 53, 'service': 'DNS', 'banner': 'BIND 9.16.1', 'state': 'Open'})
-        
-        # Sort all results by port number
-        self.open_ports.sort(key=lambda x: x['port'])
-        
-        end_time = time.time()
-        scan_duration = end_time - start_time
-        
-        # Sort results by port number
-        self.open_ports.sort(key=lambda x: x['port'])
-        
-        results += f"\nScan Summary:\n"
-        results += f"Duration: {scan_duration:.2f} seconds\n"
-        results += f"Ports scanned: {len(ports)}\n"
-        results += f"Open ports: {len(self.open_ports)}\n\n"
-        
-        if self.open_ports:
-            results += f"Open Ports:\n"
-            results += f"{'-'*80}\n"
-            results += f"{'Port':<6} {'Service':<15} {'State':<8} {'Banner':<50}\n"
-            results += f"{'-'*80}\n"
-            
-            for port_info in self.open_ports:
-                banner = port_info['banner'][:47] + "..." if len(port_info['banner']) > 50 else port_info['banner']
-                results += f"{port_info['port']:<6} {port_info['service']:<15} {port_info['state']:<8} {banner}\n"
-            
-            # Security warnings
-            results += f"\nSecurity Analysis:\n"
-            high_risk_ports = [21, 23, 135, 139, 445, 1433, 3389]
-            risky_open = [p['port'] for p in self.open_ports if p['port'] in high_risk_ports]
-            
-            if risky_open:
-                results += f"   ⚠️ High-risk ports detected: {', '.join(map(str, risky_open))}\n"
-                results += f"   Consider securing or disabling these services.\n"
-            
-            if any(p['port'] in [80, 8080] for p in self.open_ports):
-                results += f"   🔒 HTTP services detected. Consider using HTTPS.\n"
-            
-            if any(p['port'] in [22] for p in self.open_ports):
-                results += f"   🔑 SSH detected. Ensure strong authentication.\n"
-                
-        else:
-            results += "No open ports found.\n"
-            results += "This could indicate:\n"
-            results += "- Host is down or unreachable\n"
-            results += "- Firewall is blocking connections\n"
-            results += "- No services running on scanned ports\n"
-        
-        results += f"\nNote: Results may vary due to firewalls and network policies.\n"
-        
-        return results
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Port Scanner Module
+Scans specified ports on target hosts
+"""
+
+import asyncio
+import socket
+import threading
+import time
+
+# Ports flagged in the security analysis section of the report
+HIGH_RISK_PORTS = frozenset({21, 23, 135, 139, 445, 1433, 3389})
+HTTP_PORTS = frozenset({80, 8080})
+
+# Services that greet first, and the request sent to HTTP ports for a banner
+TEXT_BANNER_PORTS = frozenset({21, 22, 25, 110, 143})
+HTTP_PROBE = b"HEAD / HTTP/1.0\r\n\r\n"
+
+class PortScanner:
+    def __init__(self, timeout=3, max_threads=100):
+        self.timeout = timeout
+        self.max_threads = max_threads
+        self.open_ports = []
+        self.lock = threading.Lock()
+        
+        # Common service mappings
+        self.services = {
+            21: "FTP", 22: "SSH", 23: "Telnet", 25: "SMTP", 53: "DNS",
+            80: "HTTP", 110: "POP3", 111: "RPC", 135: "RPC", 139: "NetBIOS",
+            143: "IMAP", 443: "HTTPS", 445: "SMB", 993: "IMAPS", 995: "POP3S",
+            1433: "MSSQL", 1521: "Oracle", 3306: "MySQL", 3389: "RDP",
+            5432: "PostgreSQL", 5900: "VNC", 6379: "Redis", 8080: "HTTP-Alt",
+            8443: "HTTPS-Alt", 9200: "Elasticsearch", 27017: "MongoDB"
+        }
+    
+    def scan_port(self, target, port):
+        """Scan a single port on the target"""
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            result = sock.connect_ex((target, port))
+            
+            if result == 0:
+                service = self.services.get(port, "Unknown")
+                banner = self.grab_banner(sock, port)
+                
+                with self.lock:
+                    self.open_ports.append({
+                        'port': port,
+                        'service': service,
+                        'banner': banner,
+                        'state': 'Open'
+                    })
+                sock.close()
+                return True
+            else:
+                sock.close()
+                return False
+                
+        except socket.gaierror:
+            return False
+        except Exception:
+            return False
+    
+    def grab_banner(self, sock, port):
+        """Attempt to grab service banner"""
+        try:
+            if port in TEXT_BANNER_PORTS:  # Text-based protocols
+                sock.settimeout(2)
+                raw = sock.recv(1024)
+            elif port in HTTP_PORTS:  # HTTP
+                sock.send(HTTP_PROBE)
+                sock.settimeout(2)
+                raw = sock.recv(1024)
+            else:
+                return "Service detected"
+            return self._describe_banner(port, raw)
+        except:
+            return "No banner"
+
+    async def _grab_banner_async(self, reader, writer, port):
+        """Asyncio counterpart of grab_banner for an open stream"""
+        try:
+            if port in HTTP_PORTS:
+                writer.write(HTTP_PROBE)
+                await writer.drain()
+            elif port not in TEXT_BANNER_PORTS:
+                return "Service detected"
+            raw = await asyncio.wait_for(reader.read(1024), 2)
+            return self._describe_banner(port, raw)
+        except Exception:
+            return "No banner"
+
+    def _describe_banner(self, port, raw):
+        """Turn the first bytes a service sent into the banner shown in results"""
+        banner = raw.decode('utf-8', 'ignore').strip()
+        if port in HTTP_PORTS:
+            # Extract server header; lowercase the response once and
+            # slice the matching line out of the original text
+            start = banner.lower().find('server:')
+            if start != -1:
+                line_start = banner.rfind('\n', 0, start) + 1
+                line_end = banner.find('\n', start)
+                if line_end == -1:
+                    line_end = len(banner)
+                return banner[line_start:line_end].strip()[:100]
+            return "HTTP Service"
+        return banner[:100] if banner else "No banner"
+
+    async def _probe_port(self, target, port, limit):
+        """Connect to one port; return its open_ports entry, or None if closed"""
+        async with limit:
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(target, port), self.timeout
+                )
+            except (OSError, asyncio.TimeoutError):
+                return None
+            try:
+                banner = await self._grab_banner_async(reader, writer, port)
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+        return {
+            'port': port,
+            'service': self.services.get(port, "Unknown"),
+            'banner': banner,
+            'state': 'Open'
+        }
+
+    async def _scan_async(self, target, ports):
+        """Probe all ports concurrently, at most max_threads connections at once"""
+        limit = asyncio.Semaphore(self.max_threads)
+        found = await asyncio.gather(*(self._probe_port(target, port, limit) for port in ports))
+        return [entry for entry in found if entry]
+    
+    def parse_port_range(self, port_range):
+        """Parse port range string into list of ports"""
+        ports = []
+        
+        try:
+            if '-' in port_range:
+                start, end = map(int, port_range.split('-'))
+                if start > end or start < 1 or end > 65535:
+                    raise ValueError("Invalid port range")
+                ports = list(range(start, end + 1))
+            elif ',' in port_range:
+                ports = [int(p.strip()) for p in port_range.split(',')]
+                for port in ports:
+                    if port < 1 or port > 65535:
+                        raise ValueError("Invalid port number")
+            else:
+                port = int(port_range)
+                if port < 1 or port > 65535:
+                    raise ValueError("Invalid port number")
+                ports = [port]
+                
+        except ValueError as e:
+            if "invalid literal" in str(e):
+                raise ValueError("Invalid port format. Use: 80, 80-443, or 80,443,8080")
+            else:
+                raise e
+        
+        return ports
+    
+    def scan(self, target, port_range):
+        """Scan ports on target host"""
+        self.open_ports = []
+        start_time = time.time()
+        
+        # Check if target is localhost - use demo data for demonstration
+        is_localhost = target in ['127.0.0.1', 'localhost', '::1']
+        
+        try:
+            # Validate target; inet_aton also takes shorthand such as "10.1",
+            # so anything but a full dotted quad goes through the resolver
+            socket.inet_aton(target)
+            if target.count('.') != 3:
+                raise socket.error
+        except socket.error:
+            try:
+                target = socket.gethostbyname(target)
+            except socket.gaierror:
+                return f"Error: Unable to resolve target '{target}'"
+        
+        try:
+            ports = self.parse_port_range(port_range)
+        except ValueError as e:
+            return f"Error: {str(e)}"
+        
+        if len(ports) > 10000:
+            return "Error: Port range too large (max 10,000 ports)"
+        
+        # Report pieces are collected in a list and joined once at the end
+        lines = [
+            f"🔍 Port Scan Results for {target}\n",
+            f"{'='*50}\n\n",
+            f"Target: {target}\n",
+            f"Port Range: {port_range} ({len(ports)} ports)\n",
+            "Scanning...\n\n",
+        ]
+        
+        # Separate ports into two groups in one pass: well-known (1-1024) and
+        # high ports (1025+); high ports are only used for membership tests
+        well_known_ports = []
+        high_ports = set()
+        for p in ports:
+            if p <= 1024:
+                well_known_ports.append(p)
+            else:
+                high_ports.add(p)
+        
+        # For ports 1-1024: Do real scanning, all connects in flight together
+        if well_known_ports:
+            self.open_ports.extend(asyncio.run(self._scan_async(target, well_known_ports)))
+            lines.extend(  # Progress update
+                f"Scanned {completed}/{len(well_known_ports)} well-known ports...\n"
+                for completed in range(50, len(well_known_ports) + 1, 50)
+            )
+        
+        # For ports 1025+: Use demo data (as they're typically not open without specific services)
+        if high_ports:
+            demo_high_port_services = [
+                {'port': 8080, 'service': 'HTTP-Alt', 'banner': 'Apache httpd 2.4.41', 'state': 'Open'},
+                {'port': 8443, 'service': 'HTTPS-Alt', 'banner': 'nginx 1.18.0', 'state': 'Open'},
+                {'port': 9200, 'service': 'Elasticsearch', 'banner': 'Elasticsearch/7.14.0', 'state': 'Open'},
+                {'port': 27017, 'service': 'MongoDB', 'banner': 'MongoDB 4.4.8', 'state': 'Open'},
+                {'port': 6379, 'service': 'Redis', 'banner': 'Redis 6.2.5', 'state': 'Open'},
+            ]
+            
+            # Add demo ports that fall within the requested high port range
+            for demo_port in demo_high_port_services:
+                if demo_port['port'] in high_ports:
+                    self.open_ports.append(demo_port)
+        
+        # For localhost: If no real ports found, add demo results for education
+        if is_localhost and not self.open_ports:
+            demo_open_ports = [
+                {'port': 22, 'service': 'SSH', 'banner': 'OpenSSH 8.2p1 Ubuntu 4ubuntu0.5', 'state': 'Open'},
+                {'port': 80, 'service': 'HTTP', 'banner': 'Apache httpd 2.4.41', 'state': 'Open'},
+                {'port': 443, 'service': 'HTTPS', 'banner': 'nginx 1.18.0', 'state': 'Open'},
+                {'port': 3306, 'service': 'MySQL', 'banner': 'MySQL 8.0.28-0ubuntu0.20.04.3', 'state': 'Open'},
+                {'port': 5432, 'service': 'PostgreSQL', 'banner': 'PostgreSQL 12.9', 'state': 'Open'},
+            ]
+            
+            # Filter demo ports to match requested range
+            requested = set(ports)
+            self.open_ports = [p for p in demo_open_ports if p['port'] in requested]
+            
+            # If still no results and ports scanned, show demo ports in range
+            if not self.open_ports and ports:
+                if any(p <= 25 for p in ports):
+                    self.open_ports.append({'port': 25, 'service': 'SMTP', 'banner': 'Postfix 3.4.8', 'state': 'Open'})
+                if any(p <= 53 for p in ports):
+                    self.open_ports.append({'port': 53, 'service': 'DNS', 'banner': 'BIND 9.16.1', 'state': 'Open'})
+        
+        end_time = time.time()
+        scan_duration = end_time - start_time
+        
+        # Sort results by port number
+        self.open_ports.sort(key=lambda x: x['port'])
+        
+        lines.append(
+            f"\nScan Summary:\n"
+            f"Duration: {scan_duration:.2f} seconds\n"
+            f"Ports scanned: {len(ports)}\n"
+            f"Open ports: {len(self.open_ports)}\n\n"
+        )
+        
+        if self.open_ports:
+            lines.append(
+                f"Open Ports:\n"
+                f"{'-'*80}\n"
+                f"{'Port':<6} {'Service':<15} {'State':<8} {'Banner':<50}\n"
+                f"{'-'*80}\n"
+            )
+            
+            for port_info in self.open_ports:
+                banner = port_info['banner'][:47] + "..." if len(port_info['banner']) > 50 else port_info['banner']
+                lines.append(f"{port_info['port']:<6} {port_info['service']:<15} {port_info['state']:<8} {banner}\n")
+            
+            # Security warnings
+            lines.append("\nSecurity Analysis:\n")
+            open_numbers = [p['port'] for p in self.open_ports]
+            open_set = set(open_numbers)
+            risky_open = [p for p in open_numbers if p in HIGH_RISK_PORTS]
+            
+            if risky_open:
+                lines.append(f"   ⚠️ High-risk ports detected: {', '.join(map(str, risky_open))}\n")
+                lines.append("   Consider securing or disabling these services.\n")
+            
+            if not open_set.isdisjoint(HTTP_PORTS):
+                lines.append("   🔒 HTTP services detected. Consider using HTTPS.\n")
+            
+            if 22 in open_set:
+                lines.append("   🔑 SSH detected. Ensure strong authentication.\n")
+                
+        else:
+            lines.append(
+                "No open ports found.\n"
+                "This could indicate:\n"
+                "- Host is down or unreachable\n"
+                "- Firewall is blocking connections\n"
+                "- No services running on scanned ports\n"
+            )
+        
+        lines.append("\nNote: Results may vary due to firewalls and network policies.\n")
+        
+        return "".join(lines)
\ No newline at end of file